@@ -0,0 +1,33 @@
+"""
+Minimal stand-ins for src/utils helpers, shared by the tool wrappers.
+
+Used only when utils cannot be imported, so the wrappers keep working with
+compatible signatures.
+"""
+
+import os
+import shutil
+import subprocess
+
+def run_cmd(cmd, shell=False, check=False, use_sudo=False, timeout=300, retry=1, silent=False):
+    try:
+        if isinstance(cmd, str):
+            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check, timeout=timeout)
+        else:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+def get_executable_path(cmd):
+    # Check standard PATH
+    path = shutil.which(cmd)
+    if path:
+        return path
+    
+    # Check ~/go/bin directory
+    go_bin_path = os.path.expanduser(f"~/go/bin/{cmd}")
+    if os.path.exists(go_bin_path):
+        return go_bin_path
+    
+    return None
@@ -14,28 +14,7 @@ except ImportError:
     print("Warning: Could not import security tool wrappers (No module named 'utils')")
     print("Make sure you've run setup_tools.sh to install all required components.")
     # Provide fallback functions with compatible signatures
-    def run_cmd(cmd, shell=False, check=False, use_sudo=False, timeout=300, retry=1, silent=False):
-        try:
-            if isinstance(cmd, str):
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check, timeout=timeout)
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout)
-            return result.returncode == 0
-        except Exception:
-            return False
-    
-    def get_executable_path(cmd):
-        # Check standard PATH
-        path = shutil.which(cmd)
-        if path:
-            return path
-        
-        # Check ~/go/bin directory
-        go_bin_path = os.path.expanduser(f"~/go/bin/{cmd}")
-        if os.path.exists(go_bin_path):
-            return go_bin_path
-        
-        return None
+    from ._fallback import run_cmd, get_executable_path
 
 def run_httpx(target=None, target_list=None, output_file=None, json_output=False,
              title=False, status_code=False, tech_detect=False, web_server=False,
@@ -164,9 +143,9 @@ def parse_httpx_results(output_file, json_format=False):
         return None
     
     try:
-        results = []
         with open(output_file, 'r') as f:
             if json_format:
+                results = []
                 for line in f:
                     try:
                         results.append(json.loads(line.strip()))
@@ -174,7 +153,8 @@ def parse_httpx_results(output_file, json_format=False):
                         # Skip invalid JSON lines
                         continue
             else:
-                results = [line.strip() for line in f.readlines()]
+                # Stream lines instead of building a readlines() list first
+                results = [line.strip() for line in f]
         return results
     except Exception as e:
         print(f"Error parsing HTTPX results: {e}")
@@ -2,8 +2,17 @@
 import os
 import sys
 import json
+import logging
 import subprocess
 import shutil
+import array
+import ipaddress
+import functools
+import mmap
+import re
+import tempfile
+from types import SimpleNamespace
+from typing import List
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -14,28 +23,31 @@ except ImportError:
     print("Warning: Could not import security tool wrappers (No module named 'utils')")
     print("Make sure you've run setup_tools.sh to install all required components.")
     # Provide fallback functions with compatible signatures
-    def run_cmd(cmd, shell=False, check=False, use_sudo=False, timeout=300, retry=1, silent=False):
-        try:
-            if isinstance(cmd, str):
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check, timeout=timeout)
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout)
-            return result.returncode == 0
-        except Exception:
-            return False
-    
-    def get_executable_path(cmd):
-        # Check standard PATH
-        path = shutil.which(cmd)
-        if path:
-            return path
-        
-        # Check ~/go/bin directory
-        go_bin_path = os.path.expanduser(f"~/go/bin/{cmd}")
-        if os.path.exists(go_bin_path):
-            return go_bin_path
-        
-        return None
+    from ._fallback import run_cmd, get_executable_path
+
+logger = logging.getLogger(__name__)
+
+# Arguments that already select a scan mode, so the connect default is skipped
+_SCAN_TYPE_FLAGS = frozenset({
+    "-scan-type", "--scan-type", "-connect", "--connect",
+    "-so", "--so", "-syn", "--syn",
+})
+
+# One whole line per match; group 1 is its stripped text, or None when blank.
+# Every match consumes its line, so whitespace-only lines never rescan.
+_LINE_RE = re.compile(rb'[^\S\r\n]*(\S(?:[^\r\n]*\S)?)?[^\r\n]*(?:\r\n|\r|\n)?')
+_FIRST_BYTE_RE = re.compile(rb'\S')
+
+@functools.lru_cache(maxsize=1)
+def _get_naabu_path():
+    """Resolve the naabu executable once per session."""
+    return get_executable_path("naabu")
+
+def invalidate_naabu_cache():
+    """Clear cached naabu path, availability and capability lookups."""
+    _get_naabu_path.cache_clear()
+    check_naabu.cache_clear()
+    get_naabu_capabilities.cache_clear()
 
 def convert_port_format(ports):
     """
@@ -63,6 +75,81 @@ def convert_port_format(ports):
     # Handle other formats (ranges, specific ports) - pass through as-is
     return ports
 
+def build_naabu_cmd(naabu_path, target=None, target_list=None, ports=None, exclude_ports=None,
+                    threads=None, rate=None, timeout=None, json_output=False,
+                    output_file=None, save_output=False, tool_silent=False, additional_args=None):
+    """
+    Build the naabu argv for the given scan parameters.
+    
+    Parameters:
+        naabu_path (str): Path to the naabu executable.
+        Other parameters: Same as run_naabu().
+        
+    Returns:
+        list: Command arguments, or None if the parameters are invalid.
+    """
+    if not target and not target_list:
+        print("Error: Either target or target_list must be specified.")
+        return None
+    
+    if target_list and not os.path.isfile(target_list):
+        print(f"Error: Target list file '{target_list}' not found.")
+        return None
+    
+    # Convert port format for naabu compatibility
+    port_flag = port_value = None
+    if ports:
+        converted_ports = convert_port_format(ports)
+        if converted_ports:
+            # For "top-N" format, naabu expects just the number
+            if converted_ports.startswith("top-"):
+                try:
+                    port_flag, port_value = "-top-ports", converted_ports.split("-")[1]
+                    print(f"Using top {port_value} ports")
+                except:
+                    print("Warning: Failed to parse top ports, using default")
+            else:
+                port_flag, port_value = "-p", converted_ports
+                print(f"Using ports: {converted_ports}")
+    else:
+        # If no ports specified, use naabu's default
+        print("No ports specified, using naabu's default port selection")
+    
+    # Value flags are only emitted when set; timeout defaults to 5000ms
+    value_flags = (
+        ("-host", target),
+        ("-l", target_list),
+        (port_flag, port_value),
+        ("-exclude-ports", exclude_ports),
+        ("-c", threads),
+        ("-rate", rate),
+        ("-timeout", timeout or 5000),
+        # Only add output file if we want to save output
+        ("-o", output_file if save_output else None),
+    )
+    cmd = [naabu_path]
+    cmd.extend(part for flag, value in value_flags if value for part in (flag, str(value)))
+    
+    if json_output:
+        cmd.append("-json")
+    if tool_silent:
+        cmd.append("-silent")
+    
+    # Add any additional arguments
+    if additional_args:
+        cmd.extend(additional_args)
+    
+    # Always use connect scan mode for better compatibility across systems
+    # Compare flag names so the goflags "-scan-type=s" form is recognised too
+    if _SCAN_TYPE_FLAGS.isdisjoint(arg.split('=', 1)[0] for arg in cmd):
+        cmd.extend(["-scan-type", "connect"])
+        print("Using connect scan mode for better cross-platform compatibility")
+    
+    # Add verbose mode to see scan progress
+    if "-v" not in cmd and "--verbose" not in cmd:
+        cmd.append("-v")
+    return cmd
+
 def run_naabu(target=None, target_list=None, ports=None, exclude_ports=None, 
              threads=None, rate=None, timeout=None, json_output=False, 
              output_file=None, save_output=False, tool_silent=False, additional_args=None, auto_install=False):
@@ -100,80 +187,20 @@ def run_naabu(target=None, target_list=None, ports=None, exclude_ports=None,
             return False
     
     # Get the actual path to naabu
-    naabu_path = get_executable_path("naabu")
+    naabu_path = _get_naabu_path()
     if not naabu_path:
         print(" Naabu not found in PATH or in ~/go/bin.")
         return False
     
     print(f"Using naabu from: {naabu_path}")
     
-    if not target and not target_list:
-        print("Error: Either target or target_list must be specified.")
-        return False
-    
-    if target_list and not os.path.isfile(target_list):
-        print(f"Error: Target list file '{target_list}' not found.")
+    cmd = build_naabu_cmd(naabu_path, target=target, target_list=target_list, ports=ports,
+                          exclude_ports=exclude_ports, threads=threads, rate=rate,
+                          timeout=timeout, json_output=json_output, output_file=output_file,
+                          save_output=save_output, tool_silent=tool_silent,
+                          additional_args=additional_args)
+    if cmd is None:
         return False
-    
-    cmd = [naabu_path]
-    
-    if target:
-        cmd.extend(["-host", target])
-    if target_list:
-        cmd.extend(["-l", target_list])
-    
-    # Convert port format for naabu compatibility
-    if ports:
-        converted_ports = convert_port_format(ports)
-        if converted_ports:
-            # For "top-N" format, naabu expects just the number
-            if converted_ports.startswith("top-"):
-                try:
-                    num_ports = converted_ports.split("-")[1]
-                    cmd.extend(["-top-ports", num_ports])
-                    print(f"Using top {num_ports} ports")
-                except:
-                    print("Warning: Failed to parse top ports, using default")
-            else:
-                cmd.extend(["-p", converted_ports])
-                print(f"Using ports: {converted_ports}")
-    else:
-        # If no ports specified, use naabu's default
-        print("No ports specified, using naabu's default port selection")
-    if exclude_ports:
-        cmd.extend(["-exclude-ports", exclude_ports])
-    if threads:
-        cmd.extend(["-c", str(threads)])
-    if rate:
-        cmd.extend(["-rate", str(rate)])
-    if timeout:
-        cmd.extend(["-timeout", str(timeout)])
-    else:
-        # Set a reasonable default timeout (in milliseconds)
-        cmd.extend(["-timeout", "5000"])
-    if json_output:
-        cmd.append("-json")
-      # Only add output file if we want to save output
-    if save_output and output_file:
-        cmd.extend(["-o", output_file])
-    
-    if tool_silent:
-        cmd.append("-silent")
-    
-    # Add any additional arguments
-    if additional_args:
-        cmd.extend(additional_args)
-    
-    # Always use connect scan mode for better compatibility across systems
-    if "-scan-type" not in str(cmd) and "--scan-type" not in str(cmd):
-        if "-connect" not in str(cmd) and "--connect" not in str(cmd):
-            if "-so" not in str(cmd) and "--so" not in str(cmd) and "-syn" not in str(cmd) and "--syn" not in str(cmd):
-                cmd.extend(["-scan-type", "connect"])
-                print("Using connect scan mode for better cross-platform compatibility")
-    
-    # Add verbose mode to see scan progress
-    if "-v" not in cmd and "--verbose" not in cmd:
-        cmd.append("-v")
       # Always show real-time output to user
     print(f"Running Naabu: {' '.join(cmd)}")
 
@@ -199,60 +226,435 @@ def run_naabu(target=None, target_list=None, ports=None, exclude_ports=None,
         print(" Please check your parameters and try again.")
         return False
 
-def parse_naabu_results(output_file, json_format=False):
+def make_naabu_runner(**profile):
+    """
+    Pre-build a naabu command for a fixed scan profile.
+    
+    The argv is resolved once; the returned runner only splices in the
+    target, so scanning many targets with the same profile skips the
+    per-call flag handling in run_naabu().
+    
+    Parameters:
+        **profile: Any build_naabu_cmd() parameter except naabu_path,
+            target and target_list.
+        
+    Returns:
+        callable: run(target) -> bool, or None if naabu is missing or the
+        profile is invalid.
+    """
+    if "target" in profile or "target_list" in profile:
+        print("Error: A scan profile must not include target or target_list.")
+        return None
+    
+    naabu_path = _get_naabu_path()
+    if not naabu_path:
+        print(" Naabu not found in PATH or in ~/go/bin.")
+        return None
+    
+    placeholder = "\0target"
+    cmd = build_naabu_cmd(naabu_path, target=placeholder, **profile)
+    if cmd is None:
+        return None
+    index = cmd.index(placeholder)
+    head, tail = cmd[:index], cmd[index + 1:]
+    
+    def run(target):
+        return run_cmd(head + [target] + tail, retry=1, silent=False)
+    
+    return run
+
+async def run_naabu_async(**kwargs):
+    """
+    Run one naabu scan as an asyncio subprocess.
+    
+    Naabu's own stdout/stderr are discarded so concurrent scans do not
+    interleave on the terminal; use save_output/output_file to keep results.
+    
+    Parameters:
+        **kwargs: Any build_naabu_cmd() parameter except naabu_path.
+        
+    Returns:
+        bool: True if naabu exited successfully, False otherwise.
+    """
+    naabu_path = _get_naabu_path()
+    if not naabu_path:
+        print(" Naabu not found in PATH or in ~/go/bin.")
+        return False
+    
+    cmd = build_naabu_cmd(naabu_path, **kwargs)
+    if cmd is None:
+        return False
+    
+    import asyncio
+    
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return await process.wait() == 0
+    except OSError as e:
+        print(f" Naabu execution error: {str(e)}")
+        return False
+
+async def run_naabu_many(configs, concurrency=16):
+    """
+    Run several naabu scans concurrently.
+    
+    Port scanning is network-bound, so overlapping independent scans keeps
+    the link busy instead of waiting on one process at a time.
+    
+    Parameters:
+        configs (list): One dict of run_naabu_async() keyword arguments per scan.
+        concurrency (int): Maximum number of naabu processes at once.
+        
+    Returns:
+        list: One bool per config, in the same order.
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run_one(config):
+        async with semaphore:
+            return await run_naabu_async(**config)
+    
+    return list(await asyncio.gather(*(run_one(config) for config in configs)))
+
+def run_naabu_batch(targets, **kwargs):
+    """
+    Scan several targets with a single naabu invocation.
+    
+    Targets are written to a temporary list file and passed with -l, so a
+    batch costs one process spawn instead of one per target.
+    
+    Parameters:
+        targets (list): Hosts, IPs or CIDR ranges to scan.
+        **kwargs: Any other run_naabu() parameter except target/target_list.
+        
+    Returns:
+        bool: True if execution was successful, False otherwise.
+    """
+    targets = [str(t).strip() for t in targets if t and str(t).strip()]
+    if not targets:
+        print("Error: No targets given for batch scan.")
+        return False
+    if len(targets) == 1:
+        return run_naabu(target=targets[0], **kwargs)
+    
+    list_fd, list_path = tempfile.mkstemp(prefix="naabu_targets_", suffix=".txt")
+    try:
+        with os.fdopen(list_fd, 'w') as f:
+            f.write("\n".join(targets) + "\n")
+        print(f"Batch scanning {len(targets)} targets in one naabu run")
+        return run_naabu(target_list=list_path, **kwargs)
+    finally:
+        try:
+            os.remove(list_path)
+        except OSError:
+            pass
+
+def _map_file(f):
+    """
+    Memory-map a binary file read-only.
+    
+    Parameters:
+        f: File object opened in binary mode.
+        
+    Returns:
+        mmap.mmap: Read-only mapping, or None for an empty file.
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files cannot be mapped
+        return None
+
+def _peek_first_byte(buf):
+    """
+    Return the first non-whitespace byte of a buffer.
+    
+    Parameters:
+        buf: Bytes-like object (e.g. an mmap).
+        
+    Returns:
+        bytes: The first significant byte, or b'' for a blank buffer.
+    """
+    match = _FIRST_BYTE_RE.search(buf)
+    return match.group() if match else b''
+
+def _iter_stripped_lines(buf):
+    """
+    Yield the stripped, non-blank lines of a buffer as bytes.
+    
+    The buffer is scanned with a single compiled regex, so line splitting
+    and stripping run in C. Each match consumes exactly one line, keeping
+    the scan linear even on long whitespace-only lines.
+    
+    Parameters:
+        buf: Bytes-like object (e.g. an mmap).
+        
+    Yields:
+        bytes: One line without surrounding whitespace.
+    """
+    matches = _LINE_RE.finditer(buf)
+    try:
+        for match in matches:
+            line = match.group(1)
+            if line:
+                yield line
+    finally:
+        # The regex scanner holds a buffer export that blocks mmap.close()
+        matches = None
+
+@functools.lru_cache(maxsize=1)
+def _decoders():
+    """
+    Import the optional JSON parsers the first time naabu JSON is parsed.
+    
+    workflow.py imports this module for every scan, most of which never
+    read naabu JSON, so ijson, orjson and msgspec are not loaded up front.
+    
+    Returns:
+        SimpleNamespace: ijson/ijson_error (None without ijson), json (orjson
+        or the stdlib module), and msgspec, record_type, record_decoder and
+        record_list_decoder (None without msgspec).
+    """
+    # Optional streaming JSON parser for large JSON array outputs
+    try:
+        from ijson.common import JSONError as ijson_error  # type: ignore
+        try:
+            import ijson.backends.yajl2_c as ijson_backend  # type: ignore
+        except ImportError:
+            import ijson as ijson_backend  # type: ignore
+    except ImportError:
+        ijson_backend = ijson_error = None
+    
+    # Faster JSON decoding for JSON Lines output, falling back to the stdlib
+    try:
+        import orjson as json_backend  # type: ignore
+    except ImportError:
+        json_backend = json
+    
+    # Optional typed decoding of naabu JSON records
+    try:
+        import msgspec  # type: ignore
+    except ImportError:
+        msgspec = record_type = record_decoder = record_list_decoder = None
+    else:
+        class NaabuRecord(msgspec.Struct):
+            """Typed naabu JSON record; fields naabu adds beyond these are ignored."""
+            ip: str = ""
+            port: int = 0
+            host: str = ""
+            protocol: str = "tcp"
+        
+        record_type = NaabuRecord
+        record_decoder = msgspec.json.Decoder(NaabuRecord)
+        record_list_decoder = msgspec.json.Decoder(List[NaabuRecord])
+    
+    return SimpleNamespace(ijson=ijson_backend, ijson_error=ijson_error, json=json_backend,
+                           msgspec=msgspec, record_type=record_type,
+                           record_decoder=record_decoder, record_list_decoder=record_list_decoder)
+
+def iter_naabu_results(output_file, json_format=False, typed=False):
+    """
+    Lazily iterate over the records in a Naabu output file.
+    
+    The file is memory-mapped once and parsed in place, without read()
+    buffering or text decoding of the whole file.
+    
+    Parameters:
+        output_file (str): Path to the Naabu output file.
+        json_format (bool): Whether the output file is in JSON format.
+        typed (bool): Decode JSON records into NaabuRecord structs when
+            msgspec is installed; plain dicts are yielded otherwise.
+        
+    Yields:
+        dict, NaabuRecord or str: One parsed JSON record, or one non-empty
+        text line.
+        
+    Raises:
+        OSError: If the output file cannot be opened.
+    """
+    with open(output_file, 'rb') as f:
+        mm = _map_file(f)
+        if mm is None:
+            return
+        with mm:
+            if not json_format:
+                for line in _iter_stripped_lines(mm):
+                    yield line.decode('utf-8', 'replace')
+                return
+            
+            dec = _decoders()
+            typed = typed and dec.msgspec is not None
+            if _peek_first_byte(mm) == b'[':
+                # Parse as a single JSON array
+                if typed:
+                    try:
+                        with memoryview(mm) as view:
+                            records = dec.record_list_decoder.decode(view)
+                    except dec.msgspec.DecodeError as e:
+                        logger.debug("Invalid naabu JSON array in %s: %s", output_file, e)
+                        if dec.ijson is None:
+                            return
+                        # Fall through to the incremental parser, which
+                        # recovers the records before a truncated/invalid tail
+                    else:
+                        yield from records
+                        return
+                if dec.ijson is not None:
+                    try:
+                        # Stream the array record by record
+                        for item in dec.ijson.items(mm, 'item', use_float=True):
+                            if typed:
+                                try:
+                                    item = dec.msgspec.convert(item, dec.record_type)
+                                except dec.msgspec.ValidationError:
+                                    logger.debug("Skipping invalid naabu record in %s: %.80r", output_file, item)
+                                    continue
+                            yield item
+                    except dec.ijson_error as e:
+                        # Keep the records read before a truncated/invalid tail
+                        logger.debug("Invalid naabu JSON array tail in %s: %s", output_file, e)
+                    return
+                # A malformed array is not retried as JSON lines: its lines
+                # ("{...},") are not standalone documents, so a second pass
+                # over the file could not recover any records
+                try:
+                    if dec.json is json:
+                        # The stdlib decoder only accepts str/bytes
+                        records = json.loads(mm[:])
+                    else:
+                        # orjson decodes straight from the mapping
+                        with memoryview(mm) as view:
+                            records = dec.json.loads(view)
+                except json.JSONDecodeError as e:
+                    logger.debug("Invalid naabu JSON array in %s: %s", output_file, e)
+                    return
+                yield from records
+                return
+            
+            # Parse as JSON lines; all decoders accept bytes
+            if typed:
+                decode, decode_error = dec.record_decoder.decode, dec.msgspec.DecodeError
+            else:
+                decode, decode_error = dec.json.loads, json.JSONDecodeError
+            for line in _iter_stripped_lines(mm):
+                try:
+                    yield decode(line)
+                except decode_error:
+                    # Skip invalid JSON lines; logged lazily so the args are
+                    # only formatted when debug logging is enabled
+                    logger.debug("Skipping invalid naabu JSON line in %s: %.80r", output_file, line)
+                    continue
+
+def parse_naabu_results(output_file, json_format=False, typed=False):
     """
     Parse the Naabu output file and return the results.
     
+    Use iter_naabu_results() to process large outputs without holding
+    every record in memory.
+    
     Parameters:
         output_file (str): Path to the Naabu output file.
         json_format (bool): Whether the output file is in JSON format.
+        typed (bool): Return NaabuRecord structs instead of dicts when
+            msgspec is installed.
         
     Returns:
         list: Parsed results, or None if parsing failed.
     """
-    if not os.path.isfile(output_file):
+    try:
+        return list(iter_naabu_results(output_file, json_format, typed))
+    except (FileNotFoundError, IsADirectoryError):
         print(f"Error: Naabu output file '{output_file}' not found.")
         return None
+    except Exception as e:
+        print(f"Error parsing Naabu results: {e}")
+        return None
+
+# Protocol codes used in the "proto" column of parse_naabu_columns()
+PROTOCOL_CODES = {"tcp": 0, "udp": 1}
+
+def parse_naabu_columns(output_file, json_format=False):
+    """
+    Parse the Naabu output file into per-field columns.
+    
+    Columnar results let callers aggregate over all ports or IPs (counts,
+    top-N) with C-level loops over compact arrays instead of per-record
+    dict lookups. Records without a usable port are skipped.
+    
+    Parameters:
+        output_file (str): Path to the Naabu output file.
+        json_format (bool): Whether the output file is in JSON format.
+            Text output is expected as "host:port" lines.
+        
+    Returns:
+        dict: {"host": list, "ip": list, "port": array('I'), "proto": array('B')}
+        where proto uses PROTOCOL_CODES, or None if parsing failed.
+    """
+    hosts, ips = [], []
+    ports, protos = array.array('I'), array.array('B')
+    tcp = PROTOCOL_CODES["tcp"]
     
     try:
-        results = []
-        with open(output_file, 'r') as f:
+        for record in iter_naabu_results(output_file, json_format):
             if json_format:
+                if not isinstance(record, dict):
+                    continue
                 try:
-                    # Try parsing as a single JSON array
-                    content = f.read()
-                    if content.strip().startswith('[') and content.strip().endswith(']'):
-                        results = json.loads(content)
-                    else:
-                        # Parse as JSON lines
-                        f.seek(0)  # Go back to the beginning of the file
-                        for line in f:
-                            try:
-                                results.append(json.loads(line.strip()))
-                            except json.JSONDecodeError:
-                                # Skip invalid JSON lines
-                                continue
-                except json.JSONDecodeError:
-                    # Fall back to line-by-line parsing
-                    f.seek(0)  # Go back to the beginning of the file
-                    for line in f:
-                        try:
-                            results.append(json.loads(line.strip()))
-                        except json.JSONDecodeError:
-                            # Skip invalid JSON lines
-                            continue
+                    port = int(record.get("port"))
+                except (TypeError, ValueError):
+                    continue
+                ip = record.get("ip") or ""
+                host = record.get("host") or ip
+                proto = PROTOCOL_CODES.get(str(record.get("protocol", "tcp")).lower(), tcp)
             else:
-                results = []
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        results.append(line)
-                        
-        return results
+                host, sep, port_text = record.rpartition(":")
+                if not sep or not port_text.isdigit():
+                    continue
+                try:
+                    ip = str(ipaddress.ip_address(host.strip("[]")))
+                except ValueError:
+                    ip = ""
+                port, proto = int(port_text), tcp
+            hosts.append(host)
+            ips.append(ip)
+            ports.append(port)
+            protos.append(proto)
+    except (FileNotFoundError, IsADirectoryError):
+        print(f"Error: Naabu output file '{output_file}' not found.")
+        return None
     except Exception as e:
         print(f"Error parsing Naabu results: {e}")
         return None
+    
+    return {"host": hosts, "ip": ips, "port": ports, "proto": protos}
 
+def _probe_naabu(naabu_path, flag):
+    """
+    Run a short naabu probe (e.g. -version, -h) and capture its stdout.
+    
+    close_fds=False with an absolute path and no stdio redirected onto fds
+    0-2 lets CPython spawn the child via posix_spawn instead of fork+exec.
+    
+    Parameters:
+        naabu_path (str): Absolute path to the naabu executable.
+        flag (str): Single flag to pass to naabu.
+        
+    Returns:
+        subprocess.CompletedProcess: Result with stdout as bytes.
+    """
+    return subprocess.run([naabu_path, flag],
+                          stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL,
+                          close_fds=False,
+                          timeout=5)
+
+@functools.lru_cache(maxsize=1)
 def check_naabu():
     """
     Check if naabu is installed and available in the PATH.
@@ -260,20 +662,18 @@ def check_naabu():
     Returns:
         bool: True if naabu is installed and working, False otherwise.
     """
-    naabu_path = get_executable_path("naabu")
+    naabu_path = _get_naabu_path()
     if not naabu_path:
         print("Naabu not found in PATH or in ~/go/bin.")
         return False
         
     try:
         # Try running a simple command to check if naabu is working
-        result = subprocess.run([naabu_path, "-version"], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=5)
+        result = _probe_naabu(naabu_path, "-version")
         
         if result.returncode == 0:
-            print(f"Naabu is available: {result.stdout.strip()}")
+            version = result.stdout.strip().decode('utf-8', 'replace')
+            print(f"Naabu is available: {version}")
             return True
         else:
             print("Naabu is installed but not working correctly.")
@@ -283,6 +683,7 @@ def check_naabu():
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_naabu_capabilities():
     """
     Detect naabu capabilities by checking version and supported arguments.
@@ -295,26 +696,20 @@ def get_naabu_capabilities():
         "scan_types": [],
     }
     
-    naabu_path = get_executable_path("naabu")
+    naabu_path = _get_naabu_path()
     if not naabu_path:
         return capabilities
     
     try:
         # Get version
-        version_output = subprocess.run([naabu_path, "-version"], 
-                                     capture_output=True, 
-                                     text=True, 
-                                     timeout=5).stdout.strip()
-        capabilities["version"] = version_output
+        version_output = _probe_naabu(naabu_path, "-version").stdout.strip()
+        capabilities["version"] = version_output.decode('utf-8', 'replace')
+        
+        # Check for scan types (help text is only searched, so keep it as bytes)
+        help_output = _probe_naabu(naabu_path, "-h").stdout
         
-        # Check for scan types
-        help_output = subprocess.run([naabu_path, "-h"], 
-                                   capture_output=True, 
-                                   text=True, 
-                                   timeout=5).stdout
-                                   
-        if "-scan-type" in help_output:
-            if "SYN" in help_output and "CONNECT" in help_output:
+        if b"-scan-type" in help_output:
+            if b"SYN" in help_output and b"CONNECT" in help_output:
                 capabilities["scan_types"] = ["SYN", "CONNECT"]
             else:
                 capabilities["scan_types"] = ["CONNECT"]  # Default fallback
@@ -356,6 +751,9 @@ def auto_install_naabu():
         
         print(" Naabu installed successfully!")
         
+        # Drop the cached "not installed" lookups before verifying
+        invalidate_naabu_cache()
+        
         # Verify installation
         if check_naabu():
             print(" Naabu installation verified and working!")
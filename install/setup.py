@@ -33,13 +33,19 @@ import platform
 import subprocess
 import shutil
 import json
+import hashlib
 import time
-import ctypes
+import tarfile
+import tempfile
+import http.client
 import urllib.request
-import signal
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# src/utils.py is stdlib-only and ships next to the installer, so its helpers are reused here
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from utils import atomic_write_bytes
+
 # ANSI Color codes for output
 class Colors:
     RED = '\033[91m'
@@ -52,6 +58,11 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Platform facts are fixed for the life of the process, so resolve them once
+IS_LINUX = platform.system().lower() == "linux"
+# os.geteuid() is only available on Unix-like systems
+IS_ROOT = hasattr(os, 'geteuid') and os.geteuid() == 0
+
 # Linux distribution configurations
 SUPPORTED_DISTROS = {
     'debian': {
@@ -85,6 +96,29 @@ SUPPORTED_DISTROS = {
     }
 }
 
+# Go install targets for the security tools, keyed by binary name.
+# nuclei comes first so its template download can overlap the other builds.
+SECURITY_TOOLS = {
+    'nuclei': 'github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest',
+    'naabu': 'github.com/projectdiscovery/naabu/v2/cmd/naabu@v2.1.8',
+    'httpx': 'github.com/projectdiscovery/httpx/cmd/httpx@v1.3.7'
+}
+
+# Minimal package set installed in Phase 1, keyed by package manager
+ESSENTIAL_PACKAGES = {
+    # gcc/pkg-config are checked again before the Go builds; installing them here
+    # keeps everything in one apt transaction. libc6-dev is only a Recommends of
+    # gcc, so it is listed explicitly for cgo.
+    'apt': ['curl', 'git', 'golang-go', 'libpcap-dev', 'gcc', 'libc6-dev', 'pkg-config'],
+    'pacman': ['curl', 'git', 'go', 'libpcap'],
+}
+
+# Skip recommended extras and dpkg's pseudo-terminal progress for the batch install
+APT_BATCH_FLAGS = ['--no-install-recommends', '-o', 'Dpkg::Use-Pty=0']
+
+# Manual Go installs go to GO_INSTALL_PREFIX/go, as in the official instructions
+GO_INSTALL_PREFIX = '/usr/local'
+
 def print_header():
     """Print installation header."""
     print(f"{Colors.CYAN}{'='*80}{Colors.END}")
@@ -94,23 +128,30 @@ def print_header():
     print(f"{Colors.YELLOW}Platform: Linux-Only | Requires: Root/Sudo access{Colors.END}")
     print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
 
+def read_os_release() -> Dict[str, str]:
+    """Parse /etc/os-release into a dict of lower-cased, unquoted values (empty if unavailable)."""
+    fields = {}
+    try:
+        with open('/etc/os-release', 'r') as f:
+            for line in f:
+                key, sep, value = line.strip().partition('=')
+                if sep:
+                    fields[key] = value.strip('"\'').lower()
+    except OSError:
+        pass
+    return fields
+
 def detect_linux_distro() -> Optional[str]:
     """Detect the Linux distribution with enhanced detection."""
     try:
         # Try reading /etc/os-release first (most reliable)
-        if os.path.exists('/etc/os-release'):
-            with open('/etc/os-release', 'r') as f:
-                content = f.read()
-                if content:  # Ensure content is not None or empty
-                    content = content.lower()
-                    if 'kali' in content:
-                        return 'kali'
-                    elif 'arch' in content:
-                        return 'arch'
-                    elif 'ubuntu' in content:
-                        return 'ubuntu'
-                    elif 'debian' in content:
-                        return 'debian'
+        os_release = read_os_release()
+        if os_release:
+            # ID names the distro itself, ID_LIKE lists the families it derives from
+            candidates = [os_release.get('ID', '')] + os_release.get('ID_LIKE', '').split()
+            for distro in ('kali', 'arch', 'ubuntu', 'debian'):
+                if distro in candidates:
+                    return distro
         
         # Check /etc/debian_version for Debian-based systems
         if os.path.exists('/etc/debian_version'):
@@ -134,7 +175,7 @@ def detect_linux_distro() -> Optional[str]:
 
 def ensure_linux_only() -> bool:
     """Ensure the system is Linux-only and reject other platforms."""
-    if platform.system().lower() != "linux":
+    if not IS_LINUX:
         print(f"{Colors.RED}╔═════════════════════════════════════════════════════════════════╗{Colors.END}")
         print(f"{Colors.RED}║                               ERROR                             ║{Colors.END}")
         print(f"{Colors.RED}║                                                                 ║{Colors.END}")
@@ -153,18 +194,12 @@ def check_root_permissions() -> bool:
     """Check for root/sudo permissions."""
     try:
         # Method 1: Check effective user ID (Linux/Unix only)
-        try:
-            # On Windows, ctypes.CDLL(None) fails, so we need to check platform first
-            if platform.system().lower() == "linux":
-                euid = ctypes.CDLL(None).geteuid()
-                if euid == 0:
-                    print(f"{Colors.GREEN} Running with root privileges{Colors.END}")
-                    return True
-            else:
-                print(f"{Colors.YELLOW}  Not on Linux - skipping root user ID check{Colors.END}")
-        except (OSError, AttributeError) as e:
-            # Not on a Unix-like system or geteuid not available
-            print(f"{Colors.YELLOW}  Cannot check effective user ID: {e}{Colors.END}")
+        if IS_LINUX:
+            if IS_ROOT:
+                print(f"{Colors.GREEN} Running with root privileges{Colors.END}")
+                return True
+        else:
+            print(f"{Colors.YELLOW}  Not on Linux - skipping root user ID check{Colors.END}")
           # Method 2: Check sudo access
         print(f"{Colors.YELLOW}  Not running as root. Checking sudo access...{Colors.END}")
         try:
@@ -288,26 +323,35 @@ def validate_system_requirements() -> Tuple[bool, Optional[str]]:
     
     return True, distro
 
+# Environment overrides that keep apt/dpkg from prompting or hanging
+NONINTERACTIVE_ENV = {
+    'DEBIAN_FRONTEND': 'noninteractive',
+    'NEEDRESTART_MODE': 'a',  # Prevent needrestart from hanging
+    'UCF_FORCE_CONFOLD': '1',  # Use old config files to prevent prompts
+}
+
+def noninteractive_env() -> Dict[str, str]:
+    """Return a copy of the current environment with the non-interactive overrides applied."""
+    return {**os.environ, **NONINTERACTIVE_ENV}
+
 def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: str = "", allow_warnings: bool = True) -> bool:
     """Run command with timeout protection and enhanced progress indication."""
     try:
         print(f"{Colors.WHITE}{description}...{Colors.END}")
         
         # Create environment with non-interactive defaults
-        env = os.environ.copy()
-        env['DEBIAN_FRONTEND'] = 'noninteractive'
-        env['NEEDRESTART_MODE'] = 'a'  # Prevent needrestart from hanging
-        env['UCF_FORCE_CONFOLD'] = '1'  # Use old config files to prevent prompts
+        env = noninteractive_env()
         
-        # Start the process with more aggressive settings to prevent hangs
+        # Start the process with more aggressive settings to prevent hangs.
+        # stdout is never inspected, so discard it instead of buffering a pipe
         process = subprocess.Popen(cmd, 
-                                 stdout=subprocess.PIPE if 'Installing' in description else subprocess.DEVNULL, 
+                                 stdout=subprocess.DEVNULL, 
                                  stderr=subprocess.PIPE,
                                  env=env)
         
         # Monitor progress with timeout
         try:
-            stdout, stderr = process.communicate(timeout=timeout_seconds)
+            _, stderr = process.communicate(timeout=timeout_seconds)
             
             if process.returncode == 0:
                 print(f"{Colors.GREEN} {description} completed successfully{Colors.END}")
@@ -363,17 +407,74 @@ def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: st
         print(f"{Colors.RED} {description} failed: {e}{Colors.END}")
         return False
 
+# Set once the package index has been refreshed so later phases don't repeat it
+_package_index_updated = False
+
+def update_package_index(update_cmd: List[str], timeout_seconds: int = 300,
+                         description: str = "Repository update", force: bool = False) -> bool:
+    """Refresh the package index unless it was already refreshed this run (or force is set)."""
+    global _package_index_updated
+    if _package_index_updated and not force:
+        print(f"{Colors.GREEN} Package index already up to date, skipping {description.lower()}{Colors.END}")
+        return True
+    # Only a clean exit counts: a failed refresh must not skip the recovery refreshes
+    if run_with_timeout(update_cmd, timeout_seconds, description, allow_warnings=False):
+        _package_index_updated = True
+        return True
+    return False
+
+def dpkg_is_healthy() -> bool:
+    """Return True if dpkg is unlocked, has no interrupted run pending and --audit reports nothing."""
+    try:
+        import fcntl
+        # dpkg/apt take POSIX record locks, which lockf() probes without blocking
+        fd = os.open('/var/lib/dpkg/lock-frontend', os.O_RDWR)
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        pass  # No lock file means nobody holds it
+    except (ImportError, OSError):
+        return False
+    
+    # Journal entries left in updates/ mean a dpkg run was interrupted
+    try:
+        if os.listdir('/var/lib/dpkg/updates'):
+            return False
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    
+    try:
+        audit = subprocess.run(['dpkg', '--audit'], capture_output=True, timeout=30)
+        return audit.returncode == 0 and not audit.stdout.strip()
+    except (subprocess.SubprocessError, OSError):
+        return False
+
 def fix_package_locks() -> bool:
     """Fix common package manager lock issues with enhanced safety and longer timeouts."""
     print(f"{Colors.WHITE}Checking and fixing package locks...{Colors.END}")
     
+    # Nothing to repair on a healthy system; skip killing apt and the wait below
+    if dpkg_is_healthy():
+        print(f"{Colors.GREEN} Package manager is not locked and dpkg reports no broken packages{Colors.END}")
+        return True
+    
     # Kill any hanging processes with more aggressive approach
     try:
-        # Kill specific hanging processes
-        subprocess.run(['pkill', '-9', '-f', 'apt'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'dpkg'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'unattended-upgrade'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'needrestart'], capture_output=True, timeout=10)
+        # Kill specific hanging processes (independent, so launch them all at once)
+        hung_processes = ['apt', 'dpkg', 'unattended-upgrade', 'needrestart']
+        killers = [subprocess.Popen(['pkill', '-9', '-f', name],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                   for name in hung_processes]
+        for killer in killers:
+            try:
+                killer.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                killer.kill()
         time.sleep(3)  # Wait longer for processes to terminate
     except:
         pass
@@ -387,12 +488,11 @@ def fix_package_locks() -> bool:
     
     locks_removed = 0
     for lock_file in lock_files:
-        if os.path.exists(lock_file):
-            try:
-                os.remove(lock_file)
-                locks_removed += 1
-            except:
-                pass
+        try:
+            os.remove(lock_file)
+            locks_removed += 1
+        except OSError:
+            pass
     
     if locks_removed > 0:
         print(f"{Colors.GREEN} Removed {locks_removed} package locks{Colors.END}")
@@ -428,7 +528,8 @@ deb http://kali.download/kali kali-rolling main non-free contrib
         print(f"{Colors.GREEN} Updated Kali repositories with reliable mirrors{Colors.END}")
         
         # Update package lists with new repositories
-        if run_with_timeout(['apt', 'update'], 300, "Updating with fixed repositories"):
+        # Sources changed, so the index must be refreshed even if it was before
+        if update_package_index(['apt', 'update'], 300, "Updating with fixed repositories", force=True):
             return True
         else:
             # Restore backup if update fails
@@ -487,7 +588,7 @@ def install_libpcap_alternative() -> bool:
         print(f"{Colors.WHITE}Trying alternative repository sources...{Colors.END}")
         try:
             # Add universe repository if it doesn't exist
-            result = subprocess.run(['apt', 'update'], capture_output=True)
+            update_package_index(['apt', 'update'], 300, "Updating package lists")
             if run_with_timeout(['apt', 'install', 'libpcap-dev', '--install-suggests', '-y'], 180, "Installing with suggests"):
                 return True
         except:
@@ -527,12 +628,16 @@ def install_system_packages(distro_config: Dict) -> bool:
     try:
         print(f"\n{Colors.BLUE} Phase 1: System Package Installation (Anti-Hang Protected){Colors.END}")
 
+        # apt/dpkg specific recovery only makes sense on Debian-family systems
+        uses_apt = distro_config.get('package_manager') == 'apt'
+
         # Phase 1a: Fix package locks (especially important for VMs)
-        fix_package_locks()
+        if uses_apt:
+            fix_package_locks()
 
         # Phase 1b: Repository update with timeout protection
         print(f"{Colors.WHITE}Updating package repository (timeout: 300s)...{Colors.END}")
-        if not run_with_timeout(distro_config['update_cmd'], 300, "Repository update"):
+        if not update_package_index(distro_config['update_cmd'], 300, "Repository update"):
             print(f"{Colors.YELLOW} Repository update failed, trying recovery...{Colors.END}")
 
             # Try Kali-specific repository fixes
@@ -543,10 +648,12 @@ def install_system_packages(distro_config: Dict) -> bool:
                     print(f"{Colors.YELLOW} Kali repository fix failed, continuing...{Colors.END}")
             
             # Try alternative update methods for Kali/Debian
-            if not run_with_timeout(['apt', 'clean'], 60, "Cleaning apt cache"):
+            if not uses_apt:
+                print(f"{Colors.YELLOW} Repository update issues detected, continuing with package installation...{Colors.END}")
+            elif not run_with_timeout(['apt', 'clean'], 60, "Cleaning apt cache"):
                 print(f"{Colors.YELLOW}Cache cleaning failed, continuing anyway...{Colors.END}")
             else:
-                if not run_with_timeout(['apt', 'update', '--allow-unauthenticated'], 180, "Alternative repository update"):
+                if not update_package_index(['apt', 'update', '--allow-unauthenticated'], 180, "Alternative repository update"):
                     print(f"{Colors.YELLOW} Repository update issues detected, continuing with package installation...{Colors.END}")
         
         # Phase 1c: Check disk space before installation
@@ -567,17 +674,29 @@ def install_system_packages(distro_config: Dict) -> bool:
         
         # DRASTICALLY REDUCED package list to prevent disk space exhaustion
         # Added libpcap-dev to Stage 1 to prevent naabu compilation hanging issues
-        essential_packages = ['curl', 'git', 'golang-go', 'libpcap-dev']  # Essential packages including libpcap for naabu
+        essential_packages = list(ESSENTIAL_PACKAGES[distro_config.get('package_manager', 'apt')])  # Essential packages including libpcap for naabu
+        install_cmd = distro_config['install_cmd']
         development_packages = []  # Skip development packages for now
         final_packages = []  # Skip final packages for now
 
         # Initialize success counter
         success_count = 0
         total_packages = len(essential_packages)        # Install essential packages with non-interactive mode for safety
+        # Try a single apt transaction first so the package cache is read,
+        # dependencies resolved and dpkg triggers run only once
+        batch_cmd = install_cmd + (APT_BATCH_FLAGS if uses_apt else [])
+        if run_with_timeout(batch_cmd + essential_packages,
+                            180 * total_packages, f"Installing {' '.join(essential_packages)}",
+                            allow_warnings=False):
+            success_count = total_packages
+            essential_packages = []
+        else:
+            print(f"{Colors.YELLOW} Batch installation failed, falling back to per-package installation...{Colors.END}")
+
         for package in essential_packages:
             if package == 'libpcap-dev':
                 # Special handling for libpcap-dev
-                if run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', package, '-y'], 180, f"Installing {package}"):
+                if run_with_timeout(install_cmd + [package], 180, f"Installing {package}"):
                     success_count += 1
                 else:
                     print(f"{Colors.YELLOW} {package} standard installation failed, trying alternatives...{Colors.END}")
@@ -587,7 +706,7 @@ def install_system_packages(distro_config: Dict) -> bool:
                     else:
                         print(f"{Colors.RED} {package} installation failed completely{Colors.END}")
             else:
-                if run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', package, '-y'], 180, f"Installing {package}"):
+                if run_with_timeout(install_cmd + [package], 180, f"Installing {package}"):
                     success_count += 1
                 else:
                     print(f"{Colors.YELLOW} {package} failed, but continuing...{Colors.END}")
@@ -607,6 +726,52 @@ def install_system_packages(distro_config: Dict) -> bool:
         print(f"{Colors.RED} Package installation failed: {e}{Colors.END}")
         return False
 
+def prepend_to_path(directory: str) -> bool:
+    """Prepend a directory to PATH unless it is already an entry; return True if added."""
+    current_path = os.environ.get('PATH', '')
+    # Compare whole entries: a substring test would treat /usr/local/go/binx as a match
+    if directory in current_path.split(os.pathsep):
+        return False
+    os.environ['PATH'] = os.pathsep.join([directory, current_path]) if current_path else directory
+    return True
+
+def extract_go_archive_stream(go_url: str, prefix: str) -> None:
+    """Stream the Go archive into a staging directory and move it to prefix/go.
+
+    An existing prefix/go is only replaced once the download has been fully
+    extracted, so a dropped connection never leaves a partial tree behind.
+    """
+    staging = tempfile.mkdtemp(prefix='.go-', dir=prefix)
+    try:
+        with urllib.request.urlopen(go_url, timeout=60) as response, \
+                tarfile.open(fileobj=response, mode='r|gz') as archive:
+            if hasattr(tarfile, 'data_filter'):
+                # Reject absolute paths, links escaping staging and device files
+                archive.extractall(staging, filter='data')
+            else:
+                archive.extractall(staging)
+        target = os.path.join(prefix, 'go')
+        if os.path.lexists(target):
+            shutil.rmtree(target)
+        os.rename(os.path.join(staging, 'go'), target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+def extract_go_archive_sudo(archive_path: str, prefix: str) -> None:
+    """Extract a downloaded Go archive to prefix/go as root, staging it the same way.
+
+    Raises subprocess.CalledProcessError if any step fails.
+    """
+    staging = subprocess.run(['sudo', 'mktemp', '-d', os.path.join(prefix, '.go-XXXXXX')],
+                             capture_output=True, text=True, check=True).stdout.strip()
+    try:
+        subprocess.run(['sudo', 'tar', '-C', staging, '-xzf', archive_path], check=True)
+        target = os.path.join(prefix, 'go')
+        subprocess.run(['sudo', 'rm', '-rf', target], check=True)
+        subprocess.run(['sudo', 'mv', os.path.join(staging, 'go'), target], check=True)
+    finally:
+        subprocess.run(['sudo', 'rm', '-rf', staging])
+
 def setup_go_environment_complete() -> bool:
     """Complete Go environment setup with proper directory creation and validation."""
     try:
@@ -631,21 +796,32 @@ def setup_go_environment_complete() -> bool:
             go_archive = f"go{go_version}.linux-amd64.tar.gz"
             
             try:
-                # Download Go
-                subprocess.run([
-                    'wget', '-q', 
-                    f'https://golang.org/dl/{go_archive}',
-                    '-O', f'/tmp/{go_archive}'
-                ], check=True)
+                go_url = f'https://golang.org/dl/{go_archive}'
+                streamed = False
+                # Streaming runs in-process, so it needs write access to the
+                # prefix; otherwise go straight to the sudo fallback
+                if os.access(GO_INSTALL_PREFIX, os.W_OK):
+                    try:
+                        # Stream the archive straight into the extractor (no temp file)
+                        extract_go_archive_stream(go_url, GO_INSTALL_PREFIX)
+                        streamed = True
+                    except (OSError, tarfile.TarError, http.client.HTTPException) as e:
+                        print(f"{Colors.YELLOW} Streaming Go download failed ({e}), retrying with wget...{Colors.END}")
                 
-                # Extract Go
-                subprocess.run(['sudo', 'tar', '-C', '/usr/local', '-xzf', f'/tmp/{go_archive}'], check=True)
+                if not streamed:
+                    # Download Go
+                    subprocess.run([
+                        'wget', '-q', 
+                        go_url,
+                        '-O', f'/tmp/{go_archive}'
+                    ], check=True)
+                    
+                    # Extract Go
+                    extract_go_archive_sudo(f'/tmp/{go_archive}', GO_INSTALL_PREFIX)
                 
                 # Set up Go binary path
                 go_bin = '/usr/local/go/bin'
-                current_path = os.environ.get('PATH', '')
-                if go_bin not in current_path:
-                    os.environ['PATH'] = f"{go_bin}:{current_path}"
+                if prepend_to_path(go_bin):
                     print(f"{Colors.GREEN} Added {go_bin} to PATH{Colors.END}")
                 
                 # Verify Go installation worked
@@ -698,9 +874,7 @@ def setup_go_environment_complete() -> bool:
                     os.chmod(go_dir, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
             
             # Ensure GOBIN is in PATH for current session (CRITICAL FIX)
-            current_path = os.environ.get('PATH', '')
-            if gobin not in current_path:
-                os.environ['PATH'] = f"{gobin}:{current_path}"
+            if prepend_to_path(gobin):
                 print(f"{Colors.GREEN} Added {gobin} to current session PATH{Colors.END}")
             else:
                 print(f"{Colors.GREEN} {gobin} already in PATH{Colors.END}")
@@ -719,17 +893,19 @@ def setup_go_environment_complete() -> bool:
             
             for profile in ['.bashrc', '.zshrc']:
                 profile_path = os.path.expanduser(f'~/{profile}')
-                if os.path.exists(profile_path):
-                    # Check if Go environment is already configured
-                    with open(profile_path, 'r') as f:
-                        content = f.read()
-                    
-                    if '# Go environment' not in content:
-                        with open(profile_path, 'a') as f:
+                # Check and update the profile through a single handle; opening
+                # it directly doubles as the existence check
+                try:
+                    with open(profile_path, 'r+') as f:
+                        # Scan lines lazily; the test only runs once per profile
+                        if '# Go environment' not in (line.rstrip('\n') for line in f):
+                            # The scan read to EOF, so this appends
                             f.write('\n# Go environment\n')
                             for line in profile_lines:
                                 f.write(f'{line}\n')
-                        print(f"{Colors.GREEN} Added Go environment to {profile}{Colors.END}")
+                            print(f"{Colors.GREEN} Added Go environment to {profile}{Colors.END}")
+                except FileNotFoundError:
+                    continue
             
             # Final validation
             print(f"{Colors.WHITE}Validating Go environment...{Colors.END}")
@@ -831,9 +1007,9 @@ def check_system_dependencies(distro: str) -> bool:
                     cmd = ['pacman', '-S', '--noconfirm'] + missing_deps
                 else:
                     # Use non-interactive environment to prevent hanging
-                    cmd = ['env', 'DEBIAN_FRONTEND=noninteractive', 'NEEDRESTART_MODE=a'] + distro_config['install_cmd'] + missing_deps
+                    cmd = distro_config['install_cmd'] + missing_deps
                 
-                subprocess.run(cmd, check=True, 
+                subprocess.run(cmd, check=True, env=noninteractive_env(),
                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
                 
                 for dep in missing_deps:
@@ -844,8 +1020,9 @@ def check_system_dependencies(distro: str) -> bool:
                 print(f"{Colors.YELLOW}Please install manually: {' '.join(missing_deps)}{Colors.END}")
                 return False
         
-        # Check for broken packages
-        run_with_timeout(['apt', '--fix-broken', 'install', '-y'], 180, "Fixing broken packages")
+        # Check for broken packages (apt only; Phase 1 usually leaves nothing to fix)
+        if distro_config.get('package_manager') == 'apt' and not dpkg_is_healthy():
+            run_with_timeout(['apt', '--fix-broken', 'install', '-y'], 180, "Fixing broken packages")
         
         return True
         
@@ -950,15 +1127,15 @@ def attempt_dependency_recovery(distro: str) -> bool:
                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         else:
             print(f"{Colors.WHITE}Cleaning apt cache and updating...{Colors.END}")
-            subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt-get', 'clean'], 
+            subprocess.run(['apt-get', 'clean'], env=noninteractive_env(),
                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt-get', 'update'], check=True,
-                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            # 'apt-get clean' only drops downloaded archives, so a fresh index is still valid
+            update_package_index(['apt-get', 'update'], 300, "Updating package lists")
         
         # Try to fix broken packages
         if distro != 'arch':
             print(f"{Colors.WHITE}Fixing broken packages...{Colors.END}")
-            subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'NEEDRESTART_MODE=a', 'apt-get', 'install', '-f', '-y'], 
+            subprocess.run(['apt-get', 'install', '-f', '-y'], env=noninteractive_env(),
                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # Retry dependency installation
@@ -1025,6 +1202,68 @@ def install_nuclei_with_retries(repo, max_retries=3):
             print(f"{Colors.YELLOW}  Retrying nuclei installation...{Colors.END}")
     return False
 
+# Templates younger than this are considered fresh enough to skip the download
+NUCLEI_TEMPLATES_DIR = os.path.expanduser('~/nuclei-templates')
+NUCLEI_TEMPLATES_MAX_AGE = 24 * 60 * 60
+
+def update_nuclei_templates(force: bool = False) -> bool:
+    """Download the latest nuclei templates; failures are reported but not fatal."""
+    if not force:
+        try:
+            age = time.time() - os.path.getmtime(NUCLEI_TEMPLATES_DIR)
+        except OSError:
+            age = None
+        if age is not None and age < NUCLEI_TEMPLATES_MAX_AGE:
+            print(f"{Colors.GREEN} Nuclei templates are fresh (updated {int(age // 3600)}h ago) - skipping update{Colors.END}")
+            return True
+    print(f"{Colors.WHITE}Updating nuclei templates (optimized)...{Colors.END}")
+    try:
+        # Use non-interactive mode and extended timeout for template updates
+        env = noninteractive_env()
+        env['NUCLEI_DISABLE_COLORS'] = 'true'  # Prevent color codes from hanging terminal
+
+        # Run with extended timeout and silent mode for faster processing
+        result = subprocess.run(['nuclei', '-update-templates', '-silent'], 
+                              check=True, 
+                              stdout=subprocess.DEVNULL, 
+                              stderr=subprocess.PIPE,
+                              timeout=300,  # Extended to 5 minutes
+                              env=env)
+        print(f"{Colors.GREEN} Nuclei templates updated successfully{Colors.END}")
+        return True
+    except subprocess.TimeoutExpired:
+        print(f"{Colors.YELLOW}  Template update timed out (5min) - continuing anyway{Colors.END}")
+        print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+    except subprocess.CalledProcessError as e:
+        print(f"{Colors.YELLOW}  Template update failed - continuing anyway{Colors.END}")
+        if e.stderr:
+            error_msg = e.stderr.decode().strip()
+            if error_msg:
+                print(f"{Colors.YELLOW}  Error: {error_msg}{Colors.END}")
+        print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+    return False
+
+def install_go_tool(tool: str, repo: str, gobin: str) -> bool:
+    """Install a single Go-based tool with go install and verify the binary in gobin."""
+    try:
+        print(f"{Colors.WHITE}Installing {tool}...{Colors.END}")
+        if shutil.which(tool):
+            print(f"{Colors.GREEN}   {tool} already installed{Colors.END}")
+            return True
+        timeout_seconds = 600 if tool == 'naabu' else 450
+        if run_with_timeout(['go', 'install', '-v', '-trimpath', repo], timeout_seconds, f"Installing {tool} (timeout: {timeout_seconds//60}min)", allow_warnings=False):
+            tool_path = os.path.join(gobin, tool)
+            print(f"{Colors.WHITE}  Verifying {tool} installation at {tool_path}...{Colors.END}")
+            if os.path.exists(tool_path) and os.access(tool_path, os.X_OK):
+                print(f"{Colors.GREEN}   {tool} installed and verified at {tool_path}{Colors.END}")
+                return True
+            print(f"{Colors.RED}   {tool} installation reported success but binary not found at {tool_path}{Colors.END}")
+        else:
+            print(f"{Colors.RED}   {tool} installation failed via go install{Colors.END}")
+    except Exception as e:
+        print(f"{Colors.RED}   Failed to install {tool}: {e}{Colors.END}")
+    return False
+
 def install_security_tools_complete(distro: str) -> bool:
     """Install all security tools with enhanced dependency checking and error handling."""
     try:
@@ -1043,75 +1282,37 @@ def install_security_tools_complete(distro: str) -> bool:
             print(f"{Colors.RED} Go tools prerequisites not met{Colors.END}")
             return False
         
-        tools = {
-            'naabu': 'github.com/projectdiscovery/naabu/v2/cmd/naabu@v2.1.8',
-            'httpx': 'github.com/projectdiscovery/httpx/cmd/httpx@v1.3.7', 
-            'nuclei': 'github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest'
-        }
-        
         success_count = 0
         
-        for tool, repo in tools.items():
-            if tool == 'nuclei':
-                if install_nuclei_with_retries(repo, max_retries=3):
-                    success_count += 1
-                else:
-                    print(f"{Colors.RED}   nuclei installation failed after multiple attempts{Colors.END}")
-                    continue
-            else:
-                try:
-                    print(f"{Colors.WHITE}Installing {tool}...{Colors.END}")
-                    if shutil.which(tool):
-                        print(f"{Colors.GREEN}   {tool} already installed{Colors.END}")
-                        success_count += 1
-                        continue
-                    env = os.environ.copy()
-                    env['CGO_ENABLED'] = '1'
-                    env['GO111MODULE'] = 'on'
-                    env['GOPROXY'] = 'https://proxy.golang.org,direct'
-                    env['GOFLAGS'] = '-ldflags="-s -w"'  # Add this line to reduce binary size
-                    timeout_seconds = 600 if tool == 'naabu' else 450
-                    if run_with_timeout(['go', 'install', '-v', '-trimpath', repo], timeout_seconds, f"Installing {tool} (timeout: {timeout_seconds//60}min)", allow_warnings=False):
-                        gopath = subprocess.run(['go', 'env', 'GOPATH'], capture_output=True, text=True, check=True).stdout.strip()
-                        gobin = os.path.join(gopath, 'bin')
-                        tool_path = os.path.join(gobin, tool)
-                        print(f"{Colors.WHITE}  Verifying {tool} installation at {tool_path}...{Colors.END}")
-                        if os.path.exists(tool_path) and os.access(tool_path, os.X_OK):
-                            print(f"{Colors.GREEN}   {tool} installed and verified at {tool_path}{Colors.END}")
-                            success_count += 1
-                        else:
-                            print(f"{Colors.RED}   {tool} installation reported success but binary not found at {tool_path}{Colors.END}")
-                    else:
-                        print(f"{Colors.RED}   {tool} installation failed via go install{Colors.END}")
-                except Exception as e:
-                    print(f"{Colors.RED}   Failed to install {tool}: {e}{Colors.END}")
-          # Update nuclei templates if nuclei was installed (with optimization)
-        if shutil.which('nuclei'):
-            print(f"{Colors.WHITE}Updating nuclei templates (optimized)...{Colors.END}")
-            try:
-                # Use non-interactive mode and extended timeout for template updates
-                env = os.environ.copy()
-                env['DEBIAN_FRONTEND'] = 'noninteractive'
-                env['NUCLEI_DISABLE_COLORS'] = 'true'  # Prevent color codes from hanging terminal
-                
-                # Run with extended timeout and silent mode for faster processing
-                result = subprocess.run(['nuclei', '-update-templates', '-silent'], 
-                                      check=True, 
-                                      stdout=subprocess.DEVNULL, 
-                                      stderr=subprocess.PIPE,
-                                      timeout=300,  # Extended to 5 minutes
-                                      env=env)
-                print(f"{Colors.GREEN} Nuclei templates updated successfully{Colors.END}")
-            except subprocess.TimeoutExpired:
-                print(f"{Colors.YELLOW}  Template update timed out (5min) - continuing anyway{Colors.END}")
-                print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
-            except subprocess.CalledProcessError as e:
-                print(f"{Colors.YELLOW}  Template update failed - continuing anyway{Colors.END}")
-                if e.stderr:
-                    error_msg = e.stderr.decode().strip()
-                    if error_msg:
-                        print(f"{Colors.YELLOW}  Error: {error_msg}{Colors.END}")
-                print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+        # The template download is network-bound and independent of compiling the
+        # other tools, so it runs in the background once nuclei is available
+        from concurrent.futures import ThreadPoolExecutor
+        template_executor = ThreadPoolExecutor(max_workers=1)
+        template_update = None
+        
+        # nuclei goes first on its own: its retry path clears the shared module cache,
+        # which would break any build running alongside it
+        if install_nuclei_with_retries(SECURITY_TOOLS['nuclei'], max_retries=3):
+            success_count += 1
+            if shutil.which('nuclei'):
+                template_update = template_executor.submit(update_nuclei_templates)
+        else:
+            print(f"{Colors.RED}   nuclei installation failed after multiple attempts{Colors.END}")
+        
+        # The remaining builds are independent; the Go build cache is safe for concurrent use
+        other_tools = {tool: repo for tool, repo in SECURITY_TOOLS.items() if tool != 'nuclei'}
+        try:
+            gopath = subprocess.run(['go', 'env', 'GOPATH'], capture_output=True, text=True, check=True).stdout.strip()
+            gobin = os.path.join(gopath, 'bin')
+        except (subprocess.CalledProcessError, OSError):
+            gobin = os.path.expanduser('~/go/bin')
+        with ThreadPoolExecutor(max_workers=len(other_tools)) as executor:
+            results = executor.map(lambda item: install_go_tool(item[0], item[1], gobin), other_tools.items())
+            success_count += sum(1 for ok in results if ok)
+          # Wait for the template update started in the background after nuclei was installed
+        if template_update is not None:
+            template_update.result()
+        template_executor.shutdown()
           # Evaluate installation success - nuclei is critical for vulnerability analysis
         if success_count >= 2:  # At least 2 out of 3 tools must be installed
             # Check if nuclei specifically was installed (critical for vulnerability scanning)
@@ -1132,6 +1333,61 @@ def install_security_tools_complete(distro: str) -> bool:
         print(f"{Colors.RED} Security tools installation failed: {e}{Colors.END}")
         return False
 
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """Convert a dotted release string such as '3.1.2' into a comparable tuple."""
+    return tuple(int(part) for part in version.split('.'))
+
+def _requirement_satisfied(requirement: str) -> bool:
+    """Check whether a 'name==x.y' or 'name>=x.y' requirement is already installed."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8, let pip decide
+        return False
+    
+    for operator in ('==', '>='):
+        if operator in requirement:
+            name, required = (part.strip() for part in requirement.split(operator, 1))
+            break
+    else:
+        return False
+    
+    try:
+        installed = version(name)
+        if operator == '==':
+            return installed == required
+        return _version_tuple(installed) >= _version_tuple(required)
+    except (PackageNotFoundError, ValueError):
+        return False
+
+# Local wheel cache so re-running setup doesn't fetch the same packages again
+WHEELHOUSE_DIR = os.path.expanduser('~/.cache/mtscan-wheels')
+
+# Skip pip's self-update check and prompts, and avoid source builds where wheels exist
+PIP_FLAGS = ['--disable-pip-version-check', '--no-input', '--prefer-binary']
+
+def pip_install_from_wheelhouse(pip_args: List[str]) -> None:
+    """Install packages from the local wheelhouse, populating it from PyPI on a miss.
+
+    Falls back to a regular online pip install if the wheelhouse cannot be used.
+    Raises subprocess.CalledProcessError if that final install fails too.
+    """
+    offline_cmd = ['pip3', 'install', *PIP_FLAGS, '--no-index', '--find-links', WHEELHOUSE_DIR] + pip_args
+    try:
+        os.makedirs(WHEELHOUSE_DIR, exist_ok=True)
+        with os.scandir(WHEELHOUSE_DIR) as entries:
+            has_wheels = any(entries)
+        
+        # Try what is already cached first, then download whatever is missing
+        if has_wheels and subprocess.run(offline_cmd, stdout=subprocess.DEVNULL,
+                                         stderr=subprocess.DEVNULL).returncode == 0:
+            return
+        subprocess.run(['pip3', 'download', *PIP_FLAGS, '-d', WHEELHOUSE_DIR] + pip_args, check=True,
+                      stdout=subprocess.DEVNULL)
+        subprocess.run(offline_cmd, check=True, stdout=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"{Colors.YELLOW} Wheelhouse install failed ({e}), installing directly from PyPI...{Colors.END}")
+        subprocess.run(['pip3', 'install', *PIP_FLAGS] + pip_args, check=True, stdout=subprocess.DEVNULL)
+
 def install_python_dependencies() -> bool:
     """Install Python dependencies for enhanced functionality."""
     try:
@@ -1139,9 +1395,17 @@ def install_python_dependencies() -> bool:
         requirements_file = os.path.join(script_dir, 'config', 'requirements.txt')
         
         if os.path.exists(requirements_file):
+            with open(requirements_file, 'r') as f:
+                requirements = [line.strip() for line in f
+                                if line.strip() and not line.lstrip().startswith('#')]
+            
+            # Skip pip entirely when every pinned package is already present
+            if all(_requirement_satisfied(req) for req in requirements):
+                print(f"{Colors.GREEN} Python dependencies already satisfied{Colors.END}")
+                return True
+            
             print(f"{Colors.WHITE}Installing Python dependencies from requirements.txt...{Colors.END}")
-            subprocess.run(['pip3', 'install', '-r', requirements_file], check=True, 
-                          stdout=subprocess.DEVNULL)
+            pip_install_from_wheelhouse(['-r', requirements_file])
             print(f"{Colors.GREEN} Python dependencies installed{Colors.END}")
         else:
             # Fallback essential packages
@@ -1154,10 +1418,18 @@ def install_python_dependencies() -> bool:
                 'rich>=13.0.0'
             ]
             
+            missing_packages = []
             for package in essential_packages:
-                subprocess.run(['pip3', 'install', package], check=True, 
-                              stdout=subprocess.DEVNULL)
-                print(f"{Colors.GREEN}   {package}{Colors.END}")
+                if _requirement_satisfied(package):
+                    print(f"{Colors.GREEN}   {package} (already installed){Colors.END}")
+                else:
+                    missing_packages.append(package)
+            
+            # One pip run resolves all missing packages together
+            if missing_packages:
+                pip_install_from_wheelhouse(missing_packages)
+                for package in missing_packages:
+                    print(f"{Colors.GREEN}   {package}{Colors.END}")
             
         return True
     except Exception as e:
@@ -1179,7 +1451,7 @@ def setup_python_environment() -> bool:
                 venv_check = subprocess.run(['python3', '-m', 'venv', '--help'], capture_output=True, text=True)
                 if venv_check.returncode != 0:
                     print(f"{Colors.WHITE}Installing python3-venv...{Colors.END}")
-                    if not run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', 'python3-venv', '-y'], 180, "Installing python3-venv"):
+                    if not run_with_timeout(['apt', 'install', 'python3-venv', '-y'], 180, "Installing python3-venv"):
                         print(f"{Colors.RED} Failed to install python3-venv{Colors.END}")
                         return False
                 
@@ -1205,14 +1477,13 @@ def setup_python_environment() -> bool:
                 
                 for profile in ['.bashrc', '.zshrc']:
                     profile_path = os.path.expanduser(f'~/{profile}')
-                    if os.path.exists(profile_path):
-                        with open(profile_path, 'r') as f:
-                            content = f.read()
-                        
-                        if profile_comment not in content:
-                            with open(profile_path, 'a') as f:
+                    try:
+                        with open(profile_path, 'r+') as f:
+                            if profile_comment not in (line.rstrip('\n') for line in f):
                                 f.write(f'\n{profile_comment}\n')
                                 f.write(f'# {activation_cmd}\n')
+                    except FileNotFoundError:
+                        continue
                 
                 return True
             else:
@@ -1227,6 +1498,25 @@ def setup_python_environment() -> bool:
         print(f"{Colors.RED} Python environment setup failed: {e}{Colors.END}")
         return False
 
+# Static content of the generated aliases script, kept as bytes with its digest
+VAT_ALIASES_SCRIPT = b'''#!/bin/bash
+# Vulnerability Analysis Toolkit Aliases
+alias vat-scan="python3 $(find . -name 'workflow.py' 2>/dev/null | head -1)"
+alias vat-naabu="naabu"
+alias vat-httpx="httpx"
+alias vat-nuclei="nuclei"
+alias vat-update="nuclei -update-templates"
+'''
+VAT_ALIASES_DIGEST = hashlib.sha256(VAT_ALIASES_SCRIPT).hexdigest()
+
+def file_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
 def create_configuration_files() -> bool:
     """Create optimized configuration files."""
     try:
@@ -1276,27 +1566,19 @@ def create_configuration_files() -> bool:
         }
         
         config_file = os.path.join(config_dir, 'optimized_config.json')
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        atomic_write_bytes(config_file, json.dumps(config, indent=2).encode())
         
         print(f"{Colors.GREEN} Configuration file created: {config_file}{Colors.END}")
         
         # Create bash aliases for easy access
-        aliases_content = '''#!/bin/bash
-# Vulnerability Analysis Toolkit Aliases
-alias vat-scan="python3 $(find . -name 'workflow.py' 2>/dev/null | head -1)"
-alias vat-naabu="naabu"
-alias vat-httpx="httpx"
-alias vat-nuclei="nuclei"
-alias vat-update="nuclei -update-templates"
-'''
-        
         aliases_file = os.path.join(config_dir, 'vat_aliases.sh')
-        with open(aliases_file, 'w') as f:
-            f.write(aliases_content)
-        os.chmod(aliases_file, 0o755)
-        
-        print(f"{Colors.GREEN} Aliases created: {aliases_file}{Colors.END}")
+        if file_digest(aliases_file) == VAT_ALIASES_DIGEST:
+            print(f"{Colors.GREEN} Aliases up to date: {aliases_file}{Colors.END}")
+        else:
+            # The temp file is chmod-ed to 0755 (umask not applied) before it replaces the script
+            atomic_write_bytes(aliases_file, VAT_ALIASES_SCRIPT, mode=0o755)
+            
+            print(f"{Colors.GREEN} Aliases created: {aliases_file}{Colors.END}")
         print(f"{Colors.YELLOW} To use aliases: source {aliases_file}{Colors.END}")
         
         return True
@@ -1305,6 +1587,30 @@ alias vat-update="nuclei -update-templates"
         print(f"{Colors.RED} Configuration creation failed: {e}{Colors.END}")
         return False
 
+def _build_bin_index(dirs: List[str], wanted: List[str]) -> Dict[str, str]:
+    """Map the wanted executable names to paths, scanning each location once; earlier dirs win.
+
+    Only entries named in wanted are stat'ed, and scanning stops once all of them are found.
+    """
+    missing = set(wanted)
+    index: Dict[str, str] = {}
+    for directory in dirs:
+        if not missing:
+            break
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in missing and entry.is_file() and os.access(entry.path, os.X_OK):
+                        index[entry.name] = entry.path
+                        missing.discard(entry.name)
+                        if not missing:
+                            break
+        except OSError:
+            continue
+    return index
+
 def final_verification() -> bool:
     """Comprehensive final verification."""
     try:
@@ -1313,32 +1619,23 @@ def final_verification() -> bool:
         tools_to_check = ['naabu', 'httpx', 'nuclei', 'go']
         all_good = True
         
+        # Index every candidate bin directory once instead of probing each tool separately
+        import glob
+        bin_dirs = os.environ.get('PATH', '').split(os.pathsep) + [
+            os.path.expanduser("~/go/bin"),
+            "/usr/local/go/bin",
+            "/root/go/bin",
+        ] + glob.glob("/home/*/go/bin")
+        bin_index = _build_bin_index(bin_dirs, tools_to_check)
+        
+        def find_tool_path(tool_name):
+            return bin_index.get(tool_name)
+        
         print(f"{Colors.WHITE}Checking tool availability...{Colors.END}")
         for tool in tools_to_check:
-            # Enhanced tool detection - check multiple locations
-            tool_found = False
-            tool_path = None
+            tool_path = find_tool_path(tool)
             
-            # Check standard PATH first
-            tool_path = shutil.which(tool)
             if tool_path:
-                tool_found = True
-            else:
-                # Check common Go installation locations
-                go_locations = [
-                    os.path.expanduser(f"~/go/bin/{tool}"),
-                    f"/usr/local/go/bin/{tool}",
-                    f"/root/go/bin/{tool}",
-                    f"/home/*/go/bin/{tool}"
-                ]
-                
-                for location in go_locations:
-                    if os.path.exists(location):
-                        tool_path = location
-                        tool_found = True
-                        break
-            
-            if tool_found:
                 print(f"{Colors.GREEN}   {tool}: Available at {tool_path}{Colors.END}")
             else:
                 print(f"{Colors.RED}   {tool}: Not found{Colors.END}")
@@ -1347,25 +1644,6 @@ def final_verification() -> bool:
         # Test basic functionality with enhanced path detection
         print(f"{Colors.WHITE}Testing tool functionality...{Colors.END}")
         
-        # Function to find tool path
-        def find_tool_path(tool_name):
-            # Check standard PATH first
-            path = shutil.which(tool_name)
-            if path:
-                return path
-            
-            # Check common Go installation locations
-            go_locations = [
-                os.path.expanduser(f"~/go/bin/{tool_name}"),
-                f"/usr/local/go/bin/{tool_name}",
-                f"/root/go/bin/{tool_name}"
-            ]
-            
-            for location in go_locations:
-                if os.path.exists(location):
-                    return location
-            return None
-        
         # Test nuclei
         nuclei_path = find_tool_path('nuclei')
         if nuclei_path:
@@ -6,17 +6,15 @@ Main interface for the Linux Vulnerability Analysis Toolkit
 
 import os
 import sys
-import platform
 import subprocess
 import datetime
 import shutil
-import socket
 import re
+import heapq
 import ipaddress
 import urllib.parse
-import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -29,16 +27,10 @@ except ImportError:
     UTILS_AVAILABLE = False
     def get_executable_path(cmd):
         """Fallback function if utils not available."""
-        try:
-            result = subprocess.run(['which', cmd], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except:
-            pass
-        return None
+        return shutil.which(cmd)
 
 # Ensure we're running on Linux
-if platform.system().lower() != "linux":
+if not sys.platform.startswith("linux"):
     print("┌─────────────────────────────────────────────────────────────────┐")
     print("│                             ERROR                               │")
     print("│                                                                 │")
@@ -54,91 +46,113 @@ if platform.system().lower() != "linux":
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('clear')
+    # Emit the ANSI clear/home sequence directly instead of spawning a shell for clear(1)
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+
+# Precomposed so each redraw is a single write
+BANNER = "\n".join([
+    "╔══════════════════════════════════════════════════════════════════════════╗",
+    "║                                                                          ║",
+    "║          ███╗   ███╗████████╗███████╗ ██████╗ █████╗ ███╗   ██╗          ║",
+    "║          ████╗ ████║╚══██╔══╝██╔════╝██╔════╝██╔══██╗████╗  ██║          ║",
+    "║          ██╔████╔██║   ██║   ███████╗██║     ███████║██╔██╗ ██║          ║",
+    "║          ██║╚██╔╝██║   ██║   ╚════██║██║     ██╔══██║██║╚██╗██║          ║",
+    "║          ██║ ╚═╝ ██║   ██║   ███████║╚██████╗██║  ██║██║ ╚████║          ║",
+    "║          ╚═╝     ╚═╝   ╚═╝   ╚══════╝ ╚═════╝╚═╝  ╚═╝╚═╝  ╚═══╝          ║",
+    "║                                                                          ║",
+    "║                   Multi Tool Scan - Interactive Menu                     ║",
+    "║                  Linux Vulnerability Analysis Toolkit                    ║",
+    "║                                                                          ║",
+    "╚══════════════════════════════════════════════════════════════════════════╝",
+    "",
+]) + "\n"
 
 def print_banner():
     """Print the MTScan banner."""
-    print("╔══════════════════════════════════════════════════════════════════════════╗")
-    print("║                                                                          ║")
-    print("║          ███╗   ███╗████████╗███████╗ ██████╗ █████╗ ███╗   ██╗          ║")
-    print("║          ████╗ ████║╚══██╔══╝██╔════╝██╔════╝██╔══██╗████╗  ██║          ║")
-    print("║          ██╔████╔██║   ██║   ███████╗██║     ███████║██╔██╗ ██║          ║")
-    print("║          ██║╚██╔╝██║   ██║   ╚════██║██║     ██╔══██║██║╚██╗██║          ║")
-    print("║          ██║ ╚═╝ ██║   ██║   ███████║╚██████╗██║  ██║██║ ╚████║          ║")
-    print("║          ╚═╝     ╚═╝   ╚═╝   ╚══════╝ ╚═════╝╚═╝  ╚═╝╚═╝  ╚═══╝          ║")
-    print("║                                                                          ║")
-    print("║                   Multi Tool Scan - Interactive Menu                     ║")
-    print("║                  Linux Vulnerability Analysis Toolkit                    ║")
-    print("║                                                                          ║")
-    print("╚══════════════════════════════════════════════════════════════════════════╝")
-    print()
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+
+# Keywords used to categorize scan output lines, checked against the lowercased line
+ERROR_KEYWORDS = ('error', 'failed', 'timeout')
+WARNING_KEYWORDS = ('warning', 'warn')
+FINDING_KEYWORDS = ('open', 'found', 'vulnerable', 'critical', 'high')
+PROGRESS_KEYWORDS = ('scanning', 'testing', 'checking')
+
+# Number of finding lines repeated in the post-scan summary
+MAX_SUMMARY_FINDINGS = 10
+
+# Tool name -> resolved path (or None), reused across menu redraws
+_TOOL_PATH_CACHE = {}
 
 def find_tool_path(tool_name):
+    """Find tool path, reusing the result of earlier lookups in this session."""
+    if tool_name not in _TOOL_PATH_CACHE:
+        _TOOL_PATH_CACHE[tool_name] = _locate_tool_path(tool_name)
+    return _TOOL_PATH_CACHE[tool_name]
+
+def invalidate_tool_cache():
+    """Forget resolved tool paths so the next status check searches again."""
+    _TOOL_PATH_CACHE.clear()
+
+# Common installation paths (order matters - prefer system packages first); {0} is the tool name
+_HOME = os.path.expanduser('~')
+TOOL_SEARCH_TEMPLATES = [
+    "/usr/bin/{0}",                    # System package (apt, yum, etc.)
+    "/usr/local/bin/{0}",              # Manual system-wide installation
+    "/snap/bin/{0}",                   # Snap package
+    f"{_HOME}/go/bin/{{0}}",           # User Go installation
+    "/root/go/bin/{0}",                # Root Go installation
+    f"{_HOME}/.local/bin/{{0}}",       # Local user installation
+    "/opt/{0}/{0}",                    # Custom installation directory
+]
+
+def _locate_tool_path(tool_name):
     """Find tool path using multiple methods to handle different installations."""
-    # Common installation paths (order matters - prefer system packages first)
-    search_paths = [
-        f"/usr/bin/{tool_name}",           # System package (apt, yum, etc.)
-        f"/usr/local/bin/{tool_name}",     # Manual system-wide installation
-        f"/snap/bin/{tool_name}",          # Snap package
-        f"{os.path.expanduser('~')}/go/bin/{tool_name}",  # User Go installation
-        f"/root/go/bin/{tool_name}",       # Root Go installation
-        f"{os.path.expanduser('~')}/.local/bin/{tool_name}",  # Local user installation
-        f"/opt/{tool_name}/{tool_name}",   # Custom installation directory
-    ]
+    search_paths = [template.format(tool_name) for template in TOOL_SEARCH_TEMPLATES]
     
     # Special case for Kali Linux httpx
     if tool_name == "httpx":
         search_paths.insert(1, "/usr/bin/httpx-toolkit")
     
-    # First try using utils if available
-    if UTILS_AVAILABLE:
-        path_result = get_executable_path(tool_name)
-        if path_result and verify_tool_works(path_result):
-            return path_result
-    
-    # Fallback: try to find in PATH
-    try:
-        result = subprocess.run(['which', tool_name], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0 and result.stdout.strip():
-            tool_path = result.stdout.strip()
-            if verify_tool_works(tool_path):
-                return tool_path
-    except:
-        pass
+    # Go tools in the current user's GOPATH (go's default is ~/go)
+    for gopath in os.environ.get('GOPATH', os.path.join(_HOME, 'go')).split(os.pathsep):
+        search_paths.append(os.path.join(gopath, 'bin', tool_name))
     
-    # Then check common paths
-    for path in search_paths:
-        expanded_path = os.path.expanduser(path)
-        if os.path.isfile(expanded_path) and os.access(expanded_path, os.X_OK):
-            if verify_tool_works(expanded_path):
-                return expanded_path
+    # utils and shutil.which usually agree, and the common paths overlap both,
+    # so verify each candidate only once
+    candidates = []
+    if UTILS_AVAILABLE:
+        candidates.append(get_executable_path(tool_name))
+    candidates.append(shutil.which(tool_name))
+    candidates.extend(search_paths)
     
-    # Additional check for Go tools in current user's GOPATH
-    try:
-        gopath_result = subprocess.run(['go', 'env', 'GOPATH'], capture_output=True, text=True, timeout=5)
-        if gopath_result.returncode == 0:
-            gopath = gopath_result.stdout.strip()
-            go_tool_path = os.path.join(gopath, 'bin', tool_name)
-            if os.path.exists(go_tool_path) and verify_tool_works(go_tool_path):
-                return go_tool_path
-    except:
-        pass
+    tried = set()
+    for path in candidates:
+        if not path or path in tried:
+            continue
+        tried.add(path)
+        if verify_tool_works(path):
+            return path
     
     return None
 
 def verify_tool_works(tool_path):
     """Verify that a tool actually works by running a simple command."""
-    try:
-        # Try common version/help flags
-        for flag in ["--version", "-version", "-v", "--help", "-h"]:
-            try:
-                result = subprocess.run([tool_path, flag], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True
-            except:
-                continue
+    # Nothing to exec if the file is missing or not executable
+    if not (os.path.isfile(tool_path) and os.access(tool_path, os.X_OK)):
         return False
-    except:
+    try:
+        # A single help probe is enough: a clean exit, or a usage banner naming the tool
+        result = subprocess.run([tool_path, "--help"], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=5, check=False)
+        if result.returncode == 0:
+            return True
+        output = (result.stdout + result.stderr).lower()
+        tool_name = os.path.splitext(os.path.basename(tool_path))[0].lower()
+        return "usage" in output and tool_name in output
+    except (subprocess.TimeoutExpired, OSError):
         return False
 
 def check_tools_status():
@@ -146,74 +160,84 @@ def check_tools_status():
     tools = ['naabu', 'httpx', 'nuclei']
     status = {}
     
-    for tool in tools:
-        tool_path = find_tool_path(tool)
-        status[tool] = {
-            'installed': tool_path is not None,
-            'path': tool_path
-        }
+    # Each lookup may run the tool several times; do all three at once
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        tool_paths = executor.map(find_tool_path, tools)
+        for tool, tool_path in zip(tools, tool_paths):
+            status[tool] = {
+                'installed': tool_path is not None,
+                'path': tool_path
+            }
     
     return status
 
 def print_tools_status():
     """Print enhanced tool status with detailed information."""
-    print("TOOL STATUS CHECK:")
-    print("=" * 60)
-    
     status = check_tools_status()
     
+    # Collect the lines and write them in one go
+    lines = ["TOOL STATUS CHECK:", "=" * 60]
+    
     all_tools_ready = True
     for tool, info in status.items():
         if info['installed']:
-            print(f"  [OK]      {tool.upper():<8} Available at {info['path']}")
+            lines.append(f"  [OK]      {tool.upper():<8} Available at {info['path']}")
         else:
-            print(f"  [MISSING] {tool.upper():<8} Not found in system PATH")
+            lines.append(f"  [MISSING] {tool.upper():<8} Not found in system PATH")
             all_tools_ready = False
     
     if all_tools_ready:
-        print(f"\n[STATUS] All security tools are installed and ready")
-        print(f"[READY]  System prepared for vulnerability scanning")
+        lines.append(f"\n[STATUS] All security tools are installed and ready")
+        lines.append(f"[READY]  System prepared for vulnerability scanning")
     else:
         missing_tools = [tool for tool, info in status.items() if not info['installed']]
-        print(f"\n[WARNING] Missing tools: {', '.join(missing_tools)}")
-        print(f"[ACTION]  Run option [7] to install missing tools")
-        print(f"[PATH]    Add Go tools to PATH: export PATH=$PATH:~/go/bin")
+        lines.append(f"\n[WARNING] Missing tools: {', '.join(missing_tools)}")
+        lines.append(f"[ACTION]  Run option [7] to install missing tools")
+        lines.append(f"[PATH]    Add Go tools to PATH: export PATH=$PATH:~/go/bin")
     
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+# Precomposed so each redraw is a single write
+MAIN_MENU = "\n".join([
+    "SCAN OPERATIONS:",
+    "=" * 60,
+    "  [1] Port Discovery Scan      (naabu)",
+    "      Fast port enumeration and service detection",
+    "",
+    "  [2] HTTP Service Analysis    (httpx)",
+    "      Web service discovery and technology detection",
+    "",
+    "  [3] Vulnerability Assessment (nuclei)",
+    "      Security vulnerability scanning with 5000+ templates",
+    "",
+    "MANAGEMENT OPERATIONS:",
+    "=" * 60,
+    "  [4] View Previous Results",
+    "      Browse and analyze past scan results",
+    "",
+    "  [5] Update Nuclei Templates",
+    "      Download latest vulnerability templates",
+    "",
+    "  [6] Tool Configuration",
+    "      Configure scanning parameters and settings",
+    "",
+    "  [7] Install/Update Tools",
+    "      Install or update security scanning tools",
+    "",
+    "  [8] Help & Documentation",
+    "      View usage guides and tool documentation",
+    "",
+    "  [0] Exit Program",
+    "=" * 60,
+    "",
+]) + "\n"
 
 def print_main_menu():
     """Print enhanced main menu with better formatting."""
-    print("SCAN OPERATIONS:")
-    print("=" * 60)
-    print("  [1] Port Discovery Scan      (naabu)")
-    print("      Fast port enumeration and service detection")
-    print()
-    print("  [2] HTTP Service Analysis    (httpx)")
-    print("      Web service discovery and technology detection")
-    print()
-    print("  [3] Vulnerability Assessment (nuclei)")
-    print("      Security vulnerability scanning with 5000+ templates")
-    print()
-    print("MANAGEMENT OPERATIONS:")
-    print("=" * 60)
-    print("  [4] View Previous Results")
-    print("      Browse and analyze past scan results")
-    print()
-    print("  [5] Update Nuclei Templates")
-    print("      Download latest vulnerability templates")
-    print()
-    print("  [6] Tool Configuration")
-    print("      Configure scanning parameters and settings")
-    print()
-    print("  [7] Install/Update Tools")
-    print("      Install or update security scanning tools")
-    print()
-    print("  [8] Help & Documentation")
-    print("      View usage guides and tool documentation")
-    print()
-    print("  [0] Exit Program")
-    print("=" * 60)
-    print()
+    sys.stdout.write(MAIN_MENU)
+    sys.stdout.flush()
 
 def get_target_input():
     """Get target input from user with comprehensive validation and help."""
@@ -571,7 +595,8 @@ def run_scan(scan_type, target, **kwargs):
             bufsize=1        )
         
         # Variables to track scan progress
-        output_lines = []
+        # workflow.py writes the result files itself; only counts and a sample are kept here
+        output_line_count = 0
         last_activity = time.time()
         findings_count = 0
         
@@ -580,28 +605,40 @@ def run_scan(scan_type, target, **kwargs):
         print(f"[STATUS] Initializing {scan_type.upper()} scan...")
         print("-" * 80)
         
+        # First few finding lines, kept for the summary below
+        finding_lines = []
+        # The timestamp only changes once a second, so format it at most that often
+        last_second = None
+        current_time = ""
+        
         # Stream output in real-time
         if process.stdout:
             for line in process.stdout:
                 line = line.rstrip()
                 if line:
-                    current_time = datetime.datetime.now().strftime('%H:%M:%S')
+                    now = int(time.time())
+                    if now != last_second:
+                        current_time = time.strftime('%H:%M:%S', time.localtime(now))
+                        last_second = now
+                    line_lower = line.lower()
                     
                     # Color-code and categorize output
-                    if any(keyword in line.lower() for keyword in ['error', 'failed', 'timeout']):
+                    if any(keyword in line_lower for keyword in ERROR_KEYWORDS):
                         print(f"[{current_time}] [ERROR] {line}")
-                    elif any(keyword in line.lower() for keyword in ['warning', 'warn']):
+                    elif any(keyword in line_lower for keyword in WARNING_KEYWORDS):
                         print(f"[{current_time}] [WARN]  {line}")
-                    elif any(keyword in line.lower() for keyword in ['open', 'found', 'vulnerable', 'critical', 'high']):
+                    elif any(keyword in line_lower for keyword in FINDING_KEYWORDS):
                         findings_count += 1
+                        if len(finding_lines) < MAX_SUMMARY_FINDINGS:
+                            finding_lines.append(line)
                         print(f"[{current_time}] [FIND]  {line}")
                         print(f"[COUNTER] Total findings: {findings_count}")
-                    elif any(keyword in line.lower() for keyword in ['scanning', 'testing', 'checking']):
+                    elif any(keyword in line_lower for keyword in PROGRESS_KEYWORDS):
                         print(f"[{current_time}] [SCAN]  {line}")
                     else:
                         print(f"[{current_time}] [INFO]  {line}")
                     
-                    output_lines.append(line)
+                    output_line_count += 1
                     last_activity = time.time()
         
         # Wait for process to complete
@@ -612,7 +649,7 @@ def run_scan(scan_type, target, **kwargs):
         print("-" * 80)
         print(f"[SCAN COMPLETED] {datetime.datetime.now().strftime('%H:%M:%S')}")
         print(f"[DURATION] {elapsed_total:.2f} seconds ({elapsed_total/60:.1f} minutes)")
-        print(f"[OUTPUT LINES] {len(output_lines)} total")
+        print(f"[OUTPUT LINES] {output_line_count} total")
         print(f"[FINDINGS] {findings_count} items detected")
         print(f"[EXIT CODE] {return_code}")
         
@@ -629,16 +666,13 @@ def run_scan(scan_type, target, **kwargs):
             print("FINDINGS SUMMARY")
             print("=" * 80)
             
-            finding_lines = [line for line in output_lines if any(keyword in line.lower() 
-                           for keyword in ['open', 'found', 'vulnerable', 'critical', 'high'])]
-            
-            for i, finding in enumerate(finding_lines[:10], 1):
+            for i, finding in enumerate(finding_lines, 1):
                 print(f"{i:2d}. {finding}")
             
-            if len(finding_lines) > 10:
-                print(f"... and {len(finding_lines) - 10} more findings")
+            if findings_count > len(finding_lines):
+                print(f"... and {findings_count - len(finding_lines)} more findings")
             
-            print(f"\nTotal findings displayed: {min(len(finding_lines), 10)} of {len(finding_lines)}")
+            print(f"\nTotal findings displayed: {len(finding_lines)} of {findings_count}")
         else:
             print("\n[INFO] No significant findings detected in this scan")
         
@@ -651,17 +685,18 @@ def run_scan(scan_type, target, **kwargs):
             
             # Find and display the latest results directory
             try:
-                result_dirs = [item for item in os.listdir('.') if os.path.isdir(item) and item.startswith('results_')]
+                result_dirs = list_result_dirs(limit=1)
                 if result_dirs:
-                    latest_dir = max(result_dirs, key=lambda x: os.path.getmtime(x))
+                    latest_dir = result_dirs[0][0]
                     print(f"[DIRECTORY] {latest_dir}")
                     
                     # List key files
                     for filename in ['comprehensive_scan_report.txt', 'naabu_results.txt', 'httpx_results.txt', 'nuclei_results.txt']:
-                        filepath = os.path.join(latest_dir, filename)
-                        if os.path.exists(filepath):
-                            file_size = os.path.getsize(filepath)
-                            print(f"[FILE] {filename} ({file_size:,} bytes)")
+                        try:
+                            file_size = os.stat(os.path.join(latest_dir, filename)).st_size
+                        except FileNotFoundError:
+                            continue
+                        print(f"[FILE] {filename} ({file_size:,} bytes)")
                     
                     print(f"[ACCESS] Use menu option [4] to view detailed results")
             except OSError as e:
@@ -714,44 +749,58 @@ def run_scan(scan_type, target, **kwargs):
         return False
 
 
+def list_result_dirs(limit=None):
+    """Return (name, mtime) for the results_* directories, newest first.
+    
+    With limit, only the newest limit entries are kept, without sorting the rest.
+    """
+    # Min-heap of (mtime, name); with a limit it never grows past limit entries
+    heap = []
+    # scandir reports the entry type without an extra stat, and stat() is cached per entry
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.startswith('results_') and entry.is_dir():
+                item = (entry.stat().st_mtime, entry.name)
+                if limit is None or len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif heap and item > heap[0]:
+                    heapq.heapreplace(heap, item)
+    return [(name, mtime) for mtime, name in sorted(heap, reverse=True)]
+
 def view_results():
     """View previous scan results."""
     clear_screen()
     print_banner()
-    print("PREVIOUS SCAN RESULTS:")
-    print("=" * 50)
+    # The whole screen is collected here and written once
+    lines = ["PREVIOUS SCAN RESULTS:", "=" * 50]
     
-    # Find all result directories
-    result_dirs = []
-    for item in os.listdir('.'):
-        if os.path.isdir(item) and item.startswith('results_'):
-            result_dirs.append(item)
+    # Find all result directories (newest first)
+    result_entries = list_result_dirs(limit=10)  # Show last 10
+    result_dirs = [name for name, _ in result_entries]
     
     if not result_dirs:
-        print("No previous scan results found.")
+        lines.append("No previous scan results found.")
+        sys.stdout.write("\n".join(lines) + "\n")
         input("\nPress Enter to continue...")
         return
     
-    # Sort by modification time (newest first)
-    result_dirs.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-    
     # Display results
-    for i, result_dir in enumerate(result_dirs[:10], 1):  # Show last 10
-        stat = os.stat(result_dir)
-        mod_time = datetime.datetime.fromtimestamp(stat.st_mtime)
-        print(f"  [{i}] {result_dir} - {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    for i, (result_dir, mtime) in enumerate(result_entries, 1):
+        mod_time = datetime.datetime.fromtimestamp(mtime)
+        lines.append(f"  [{i}] {result_dir} - {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    print(f"\n  [0] Back to main menu")
+    lines.append(f"\n  [0] Back to main menu")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     while True:
-        choice = input("\nSelect result to view [0-{}]: ".format(len(result_dirs[:10]))).strip()
+        choice = input("\nSelect result to view [0-{}]: ".format(len(result_dirs))).strip()
         
         if choice == "0":
             return
         
         try:
             idx = int(choice) - 1
-            if 0 <= idx < len(result_dirs[:10]):
+            if 0 <= idx < len(result_dirs):
                 view_result_details(result_dirs[idx])
                 return
             else:
@@ -763,39 +812,65 @@ def view_result_details(result_dir):
     """View details of a specific result directory."""
     clear_screen()
     print_banner()
-    print(f"SCAN RESULTS: {result_dir}")
-    print("=" * 60)
+    # Header and body are collected and written together
+    lines = [f"SCAN RESULTS: {result_dir}", "=" * 60]
     
     # Look for the comprehensive report file
     comprehensive_report = os.path.join(result_dir, "comprehensive_scan_report.txt")
     
     try:
-        if os.path.exists(comprehensive_report):
-            print("COMPREHENSIVE SCAN REPORT:")
-            print("-" * 40)
-            with open(comprehensive_report, 'r') as f:
-                content = f.read()
-                print(content)
-        else:
+        # Opening directly answers "does it exist" without a separate stat
+        try:
+            # workflow.py writes the report as UTF-8; replace any stray bytes from tool output instead of failing mid-copy
+            with open(comprehensive_report, 'r', encoding='utf-8', errors='replace') as f:
+                lines.extend(["COMPREHENSIVE SCAN REPORT:", "-" * 40])
+                sys.stdout.write("\n".join(lines) + "\n")
+                lines.clear()
+                # Copy in chunks rather than loading the whole report into one string
+                shutil.copyfileobj(f, sys.stdout)
+            sys.stdout.write("\n")
+        except FileNotFoundError:
             # Fallback: show directory contents if comprehensive report not found
-            print("Directory contents:")
-            files = os.listdir(result_dir)
-            for file in sorted(files):
-                file_path = os.path.join(result_dir, file)
-                if os.path.isfile(file_path):
-                    size = os.path.getsize(file_path)
-                    print(f"    {file} ({size} bytes)")
-                elif os.path.isdir(file_path):
-                    print(f"    {file}/")
+            lines.append("Directory contents:")
+            with os.scandir(result_dir) as entries:
+                files = sorted(entries, key=lambda entry: entry.name)
+            for entry in files:
+                if entry.is_file():
+                    lines.append(f"    {entry.name} ({entry.stat().st_size} bytes)")
+                elif entry.is_dir():
+                    lines.append(f"    {entry.name}/")
             
-            print("\nNote: No comprehensive_scan_report.txt found.")
-            print("This might be an older scan result or incomplete scan.")
+            lines.append("\nNote: No comprehensive_scan_report.txt found.")
+            lines.append("This might be an older scan result or incomplete scan.")
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
         
     except Exception as e:
+        # Emit whatever was collected before the failure
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
         print(f"Error reading results: {e}")
     
     input("\nPress Enter to continue...")
 
+def run_foreground(cmd, timeout):
+    """Run cmd attached to the terminal and return its exit code.
+    
+    On timeout or Ctrl-C the child is asked to stop (then killed after 5s)
+    before the exception is re-raised, so nothing keeps running behind the menu.
+    """
+    process = subprocess.Popen(cmd)
+    try:
+        return process.wait(timeout=timeout)
+    except (KeyboardInterrupt, subprocess.TimeoutExpired):
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        raise
+
 def update_templates():
     """Update nuclei templates."""
     clear_screen()
@@ -805,15 +880,16 @@ def update_templates():
     
     try:
         print("Running: nuclei -update-templates")
-        result = subprocess.run(["nuclei", "-update-templates"], 
-                              timeout=300,  # 5 minute timeout
-                              capture_output=False)  # Show output in real-time
+        # Output goes straight to the terminal so nuclei's progress is shown in real-time
+        returncode = run_foreground(["nuclei", "-update-templates"], timeout=300)  # 5 minute timeout
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("Templates updated successfully!")
         else:
             print("Template update completed with warnings.")
     
+    except KeyboardInterrupt:
+        print("\nTemplate update cancelled.")
     except subprocess.TimeoutExpired:
         print("Template update timed out after 5 minutes.")
         print("You can try updating manually later: nuclei -update-templates")
@@ -825,43 +901,48 @@ def update_templates():
     
     input("\nPress Enter to continue...")
 
+# Static help page, written in one go by show_help
+HELP_TEXT = "\n".join([
+    "HELP & DOCUMENTATION:",
+    "=" * 50,
+    "",
+    "TOOL DESCRIPTIONS:",
+    "  • naabu   - Fast port scanner for network reconnaissance",
+    "  • httpx   - HTTP toolkit for service discovery and analysis",
+    "  • nuclei  - Vulnerability scanner with 5000+ templates",
+    "",
+    "SCAN TYPES:",
+    "  • Port Scan      - Discover open ports on target",
+    "  • HTTP Detection - Find HTTP services and gather info",
+    "  • Vuln Scan      - Check for known vulnerabilities",
+    "",
+    "OPTIONS:",
+    "  • Stealth Mode   - Slower, more discreet scanning",
+    "  • Save Output    - Save results to files",
+    "  • JSON Output    - Machine-readable output format",
+    "",
+    "DOCUMENTATION:",
+    "  • README.md      - General overview and quick start",
+    "  • docs/USAGE.md  - Detailed usage examples",
+    "  • docs/INSTALL.md - Installation instructions",
+    "",
+    "GETTING STARTED:",
+    "  • Run: python mtscan.py",
+    "  • Or: python src/workflow.py <target>",
+    "",
+    "EXAMPLES:",
+    "  Target formats:",
+    "    • 192.168.1.100",
+    "    • example.com",
+    "    • https://target.com",
+    "",
+]) + "\n"
+
 def show_help():
     """Show help and documentation."""
     clear_screen()
     print_banner()
-    print("HELP & DOCUMENTATION:")
-    print("=" * 50)
-    print()
-    print("TOOL DESCRIPTIONS:")
-    print("  • naabu   - Fast port scanner for network reconnaissance")
-    print("  • httpx   - HTTP toolkit for service discovery and analysis")
-    print("  • nuclei  - Vulnerability scanner with 5000+ templates")
-    print()
-    print("SCAN TYPES:")
-    print("  • Port Scan      - Discover open ports on target")
-    print("  • HTTP Detection - Find HTTP services and gather info")
-    print("  • Vuln Scan      - Check for known vulnerabilities")
-    print()
-    print("OPTIONS:")
-    print("  • Stealth Mode   - Slower, more discreet scanning")
-    print("  • Save Output    - Save results to files")
-    print("  • JSON Output    - Machine-readable output format")
-    print()
-    print("DOCUMENTATION:")
-    print("  • README.md      - General overview and quick start")
-    print("  • docs/USAGE.md  - Detailed usage examples")
-    print("  • docs/INSTALL.md - Installation instructions")
-    print()
-    print("GETTING STARTED:")
-    print("  • Run: python mtscan.py")
-    print("  • Or: python src/workflow.py <target>")
-    print()
-    print("EXAMPLES:")
-    print("  Target formats:")
-    print("    • 192.168.1.100")
-    print("    • example.com")
-    print("    • https://target.com")
-    print()
+    sys.stdout.write(HELP_TEXT)
     
     input("Press Enter to continue...")
 
@@ -881,23 +962,26 @@ def install_tools():
     
     try:
         print("Running installation script...")
-        # Try without sudo first, then with sudo if needed
+        # Try without sudo first, then with sudo if needed; the timeout and
+        # cancel handling below covers both attempts
+        setup_cmd = ["python3", "install/setup.py"]
         try:
-            result = subprocess.run(["python3", "install/setup.py"], 
-                                  timeout=1800)  # 30 minute timeout
+            try:
+                returncode = run_foreground(setup_cmd, timeout=1800)  # 30 minute timeout
+            except PermissionError:
+                print("Permission denied, trying with sudo...")
+                returncode = run_foreground(["sudo"] + setup_cmd, timeout=1800)
         except subprocess.TimeoutExpired:
             print("Installation timed out after 30 minutes.")
-            result = subprocess.CompletedProcess(args=[], returncode=1)
-        except PermissionError:
-            print("Permission denied, trying with sudo...")
-            try:
-                result = subprocess.run(["sudo", "python3", "install/setup.py"], 
-                                      timeout=1800)
-            except subprocess.TimeoutExpired:
-                print("Installation timed out after 30 minutes.")
-                result = subprocess.CompletedProcess(args=[], returncode=1)
+            returncode = 1
+        except KeyboardInterrupt:
+            print("\nInstallation cancelled.")
+            returncode = 1
         
-        if result.returncode == 0:
+        # Tools may have been added or moved; re-resolve them on the next redraw
+        invalidate_tool_cache()
+        
+        if returncode == 0:
             print("Installation completed successfully!")
         else:
             print("Installation completed with some issues.")
@@ -1710,6 +1794,30 @@ def show_scan_type_help(scan_type):
     
     print("="*60)
 
+def scan_target_with(scan_type):
+    """Ask for a target and run the given scan against it."""
+    target = get_target_input()
+    if target:
+        run_scan(scan_type, target)
+
+def show_tool_configuration():
+    """Placeholder for the tool configuration screen."""
+    print("\nTool Configuration")
+    print("Configuration options will be available in future updates.")
+    input("Press Enter to continue...")
+
+# Menu choice -> handler; option 0 (exit) is handled by the loop itself
+MENU_ACTIONS = {
+    "1": lambda: scan_target_with("naabu"),     # Port Scan (naabu)
+    "2": lambda: scan_target_with("httpx"),     # HTTP Service Detection (httpx)
+    "3": lambda: scan_target_with("nuclei"),    # Vulnerability Scan (nuclei)
+    "4": view_results,
+    "5": update_templates,
+    "6": show_tool_configuration,
+    "7": install_tools,
+    "8": show_help,
+}
+
 def main():
     """Main menu loop."""
     while True:
@@ -1723,33 +1831,10 @@ def main():
         if choice == "0":
             print("\nGoodbye!")
             break
-        elif choice == "1":
-            # Port Scan (naabu)
-            target = get_target_input()
-            if target:
-                run_scan("naabu", target)
-        elif choice == "2":
-            # HTTP Service Detection (httpx)
-            target = get_target_input()
-            if target:
-                run_scan("httpx", target)
-        elif choice == "3":
-            # Vulnerability Scan (nuclei)
-            target = get_target_input()
-            if target:
-                run_scan("nuclei", target)
-        elif choice == "4":
-            view_results()
-        elif choice == "5":
-            update_templates()
-        elif choice == "6":
-            print("\nTool Configuration")
-            print("Configuration options will be available in future updates.")
-            input("Press Enter to continue...")
-        elif choice == "7":
-            install_tools()
-        elif choice == "8":
-            show_help()
+        
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            action()
         else:
             print("Invalid option. Please select 0-8.")
             input("Press Enter to continue...")
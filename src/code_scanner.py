@@ -160,14 +160,18 @@ def scan_file(file_path: str) -> List[Dict[str, Any]]:
     # Get patterns for the language
     patterns = VULNERABILITY_PATTERNS.get(language, [])
     
+    # Split once for the whole file rather than once per match
+    lines = content.split('\n')
+    
     # Scan for each pattern
     for pattern_info in patterns:
         pattern = pattern_info["pattern"]
         matches = re.finditer(pattern, content, re.IGNORECASE)
         
         for match in matches:
-            line_number = content[:match.start()].count('\n') + 1
-            line_content = content.split('\n')[line_number - 1].strip()
+            # Count newlines in place instead of slicing off a copy of the prefix
+            line_number = content.count('\n', 0, match.start()) + 1
+            line_content = lines[line_number - 1].strip()
             
             findings.append({
                 "file": file_path,
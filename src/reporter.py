@@ -631,6 +631,47 @@ class AdvancedReporter:
         return priority_map.get(risk_level, "P3 - Next cycle")
 
 
+def _load_json_records(path: str) -> List[Any]:
+    """
+    Load records from a file holding either a JSON array or JSON Lines.
+    
+    The format is detected from the first non-whitespace character, so the
+    file is read once instead of being buffered whole and then re-read.
+    
+    Args:
+        path: File to load
+        
+    Returns:
+        List of decoded records (invalid JSON Lines are logged and skipped)
+    """
+    name = os.path.basename(path)
+    with open(path, 'r') as f:
+        first = ""
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                break
+            stripped = chunk.lstrip()
+            if stripped:
+                first = stripped[0]
+                break
+        f.seek(0)
+        
+        if first == '[':
+            # It's a JSON array
+            return json.load(f)
+        
+        # It's likely JSONL, parse line by line
+        records = []
+        for line in f:
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON in {name}: {line.strip()} - {str(e)}")
+        return records
+
+
 def parse_scan_results(output_dir: str) -> Dict[str, Any]:
     """
     Parse various output files and extract findings.
@@ -681,27 +722,9 @@ def parse_scan_results(output_dir: str) -> Dict[str, Any]:
     ports_json = os.path.join(output_dir, "ports.json")
     if os.path.exists(ports_json):
         try:
-            with open(ports_json, 'r') as f:
-                # Handle both JSON array format and JSONL format
-                content = f.read().strip()
-                if content.startswith('[') and content.endswith(']'):
-                    # It's a JSON array
-                    ports_data = json.loads(content)
-                    results["ports"] = ports_data
-                    results["summary"]["open_ports"] = len(ports_data)
-                else:
-                    # It's likely JSONL, parse line by line
-                    f.seek(0)
-                    ports_data = []
-                    for line in f:
-                        if line.strip():
-                            try:
-                                port_entry = json.loads(line)
-                                ports_data.append(port_entry)
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Invalid JSON in ports.json: {line.strip()} - {str(e)}")
-                    results["ports"] = ports_data
-                    results["summary"]["open_ports"] = len(ports_data)
+            ports_data = _load_json_records(ports_json)
+            results["ports"] = ports_data
+            results["summary"]["open_ports"] = len(ports_data)
             logger.info(f"Parsed {len(results['ports'])} ports from {ports_json}")
         except Exception as e:
             logger.error(f"Error parsing ports.json: {e}")
@@ -711,25 +734,9 @@ def parse_scan_results(output_dir: str) -> Dict[str, Any]:
     http_json = os.path.join(output_dir, "http_services.json")
     if os.path.exists(http_json):
         try:
-            with open(http_json, 'r') as f:
-                content = f.read().strip()
-                if content.startswith('[') and content.endswith(']'):
-                    http_data = json.loads(content)
-                    results["http_services"] = http_data
-                    results["summary"]["http_services"] = len(http_data)
-                else:
-                    # Parse line by line for JSONL format
-                    f.seek(0)
-                    http_data = []
-                    for line in f:
-                        if line.strip():
-                            try:
-                                service_entry = json.loads(line)
-                                http_data.append(service_entry)
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Invalid JSON in http_services.json: {line.strip()} - {str(e)}")
-                    results["http_services"] = http_data
-                    results["summary"]["http_services"] = len(http_data)
+            http_data = _load_json_records(http_json)
+            results["http_services"] = http_data
+            results["summary"]["http_services"] = len(http_data)
             logger.info(f"Parsed {len(results['http_services'])} HTTP services from {http_json}")
         except Exception as e:
             logger.error(f"Error parsing http_services.json: {e}")
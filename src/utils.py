@@ -5,56 +5,106 @@ import platform
 import subprocess
 import shutil
 import time
+import random
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from pathlib import Path
 from typing import List, Dict, Any, Union, Optional, Tuple
 
 # Constants for reuse across modules
 DEFAULT_TIMEOUT = 300
 DEFAULT_RETRY = 1
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
 SECURITY_TOOLS = ["naabu", "httpx", "nuclei"]
 
-def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False, use_sudo: bool = False, timeout: int = DEFAULT_TIMEOUT, retry: int = DEFAULT_RETRY, silent: bool = False) -> bool:
-    """Enhanced command runner with real-time output for security tools."""
+# Platform facts do not change during a run, so resolve them once
+_SYSTEM = platform.system().lower()
+_IS_LINUX = _SYSTEM == "linux"
+_IS_WINDOWS = _SYSTEM == "windows"
+# os.geteuid() is only available on Unix-like systems
+_EUID = os.geteuid() if hasattr(os, 'geteuid') else None # type: ignore
+
+# Common Go tool installation locations searched after PATH
+_EXTRA_BIN_DIRS = [
+    os.path.expanduser("~/go/bin"),           # User's go/bin
+    "/root/go/bin",                           # Root's go/bin (common in Kali)
+    "/usr/local/go/bin",                      # System Go installation
+    "/usr/bin",                               # System package manager
+    "/usr/local/bin",                         # Local installation
+    "/opt/go/bin",                            # Alternative Go location
+    os.path.expanduser("~/.local/bin"),       # User's local bin
+    "/snap/bin",                              # Snap packages
+]
+
+# Set once check_network succeeds; failures are re-checked on the next call
+_NETWORK_OK = False
+
+# Executable name -> resolved path, filled by get_executable_path
+_EXECUTABLE_CACHE: Dict[str, str] = {}
+
+def _should_retry_and_sleep(attempt: int, retry: int, silent: bool, message: str = "Retrying",
+                            base_delay: float = RETRY_BASE_DELAY, max_delay: float = RETRY_MAX_DELAY) -> bool:
+    """Sleep with jittered exponential backoff and return True if another attempt remains."""
+    if attempt >= retry:
+        return False
+    if not silent:
+        print(f"{message} ({attempt+1}/{retry})...")
+    time.sleep(min(max_delay, base_delay * (2 ** attempt)) * random.uniform(0.8, 1.2))
+    return True
+
+def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False, use_sudo: bool = False, timeout: int = DEFAULT_TIMEOUT, retry: int = DEFAULT_RETRY, silent: bool = False, env: Optional[Dict[str, str]] = None) -> bool:
+    """Enhanced command runner with real-time output for security tools.
+    
+    Extra environment variables in env are layered over os.environ, which avoids
+    wrapping commands in a shell just to set something like DEBIAN_FRONTEND.
+    """
     if isinstance(cmd, list):
         cmd_str = ' '.join(cmd)
     else:
         cmd_str = cmd
         
+    # Handle sudo and Windows special case in a platform-independent way
+    if use_sudo and not _IS_WINDOWS and _EUID not in (None, 0):
+        cmd = ["sudo"] + cmd if isinstance(cmd, list) else f"sudo {cmd}"
+    
+    # sudo -E keeps the extra variables across the privilege switch
+    if env:
+        if isinstance(cmd, list) and cmd[:1] == ["sudo"]:
+            cmd = ["sudo", "-E"] + cmd[1:]
+        env = {**os.environ, **env}
+    
+    # Fire-and-forget calls need no retry bookkeeping or output handling
+    if silent and not check and retry == 0:
+        try:
+            return subprocess.call(cmd, shell=shell, env=env, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=timeout) == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+    
     for attempt in range(retry + 1):
         try:
             if not silent:
                 print(f"Running: {cmd_str}")
             
-            # Handle sudo and Windows special case in a platform-independent way
-            if use_sudo and platform.system().lower() != "windows":
-                try:
-                    # os.geteuid() is only available on Unix-like systems
-                    if hasattr(os, 'geteuid') and os.geteuid() != 0: # type: ignore
-                        if isinstance(cmd, list):
-                            cmd = ["sudo"] + cmd
-                        else:
-                            cmd = f"sudo {cmd}"
-                except AttributeError:
-                    # We're not on a Unix system, so we can't use sudo
-                    pass
-            
             # For security tools, we want real-time output, so don't capture stdout/stderr
             # unless explicitly silenced
             if silent:
-                # Silent mode - capture all output
+                # Silent mode - discard all output
                 process = subprocess.Popen(
                     cmd, 
                     shell=shell, 
+                    env=env,
                     stdout=subprocess.DEVNULL, 
-                    stderr=subprocess.DEVNULL, 
-                    text=True
+                    stderr=subprocess.DEVNULL
                 )
             else:
                 # Real-time mode - let output pass through to terminal
                 process = subprocess.Popen(
                     cmd, 
                     shell=shell, 
+                    env=env,
                     text=True
                 )
             
@@ -65,10 +115,7 @@ def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False
                 # Check return code
                 if process.returncode != 0:
                     # Retry logic
-                    if attempt < retry:
-                        if not silent:
-                            print(f"Command failed. Retrying ({attempt+1}/{retry})...")
-                        time.sleep(2 * (attempt + 1))  # Exponential backoff
+                    if _should_retry_and_sleep(attempt, retry, silent, "Command failed. Retrying"):
                         continue
                     
                     if check:
@@ -78,33 +125,29 @@ def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False
                 return True
                 
             except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
+                # Give the process a chance to clean up before forcing it
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
                 if not silent:
                     print(f"Command timed out after {timeout} seconds: {cmd_str}")
-                if attempt < retry:
-                    if not silent:
-                        print(f"Retrying ({attempt+1}/{retry})...")
-                    time.sleep(2 * (attempt + 1))
+                if _should_retry_and_sleep(attempt, retry, silent):
                     continue
                 return False
                 
         except subprocess.CalledProcessError as e:
             if not silent:
                 print(f"Command failed: {e}")
-            if attempt < retry:
-                if not silent:
-                    print(f"Retrying ({attempt+1}/{retry})...")
-                time.sleep(2 * (attempt + 1))
+            if _should_retry_and_sleep(attempt, retry, silent):
                 continue
             return False
         except Exception as e:
             if not silent:
                 print(f"Error running command {cmd_str}: {str(e)}")
-            if attempt < retry:
-                if not silent:
-                    print(f"Retrying ({attempt+1}/{retry})...")
-                time.sleep(2 * (attempt + 1))
+            if _should_retry_and_sleep(attempt, retry, silent):
                 continue
             return False
     
@@ -114,7 +157,7 @@ def check_required_commands(commands: List[str]) -> List[str]:
     """Check if required commands are available and return missing ones."""
     missing = []
     for cmd in commands:
-        if not shutil.which(cmd) and not os.path.exists(os.path.expanduser(f"~/go/bin/{cmd}")):
+        if not get_executable_path(cmd):
             missing.append(cmd)
     return missing
 
@@ -145,14 +188,36 @@ def safe_read_json(json_file: str, default: Any = None) -> Any:
         print(f"Error reading {json_file}: {e}")
         return default
 
+def atomic_write_bytes(path: str, data: bytes, mode: int = 0o644) -> None:
+    """Write data to a temporary sibling file and rename it over path.
+
+    Readers see either the old file or the complete new one, never a partial write.
+    The temporary file is removed if any step fails.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp = tempfile.NamedTemporaryFile('wb', dir=directory, prefix=f'.{name}.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
 def safe_write_json(data: Any, json_file: str) -> bool:
     """Safely write data to a JSON file with error handling."""
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(os.path.abspath(json_file)), exist_ok=True)
         
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a sibling temp file and rename so readers never see a partial file
+        atomic_write_bytes(json_file, json.dumps(data, indent=2).encode('utf-8'))
         return True
     except Exception as e:
         print(f"Error writing to {json_file}: {e}")
@@ -168,13 +233,11 @@ def check_tools_installation() -> Dict[str, Dict[str, Any]]:
     
     for tool, data in tools.items():
         # Check if tool exists in PATH or ~/go/bin
-        tool_path = shutil.which(tool)
-        if not tool_path and os.path.exists(os.path.expanduser(f"~/go/bin/{tool}")):
-            tool_path = os.path.expanduser(f"~/go/bin/{tool}")
+        tool_path = get_executable_path(tool)
         
         if tool_path:
             try:
-                result = subprocess.run(data["command"].split(), 
+                result = subprocess.run([tool_path] + data["command"].split()[1:], 
                                       capture_output=True, 
                                       text=True, 
                                       timeout=5)
@@ -187,17 +250,46 @@ def check_tools_installation() -> Dict[str, Dict[str, Any]]:
     
     return tools
 
+def _has_route(host: str) -> bool:
+    """Return False immediately if the kernel has no route to host (no packets are sent)."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            # connect() on a UDP socket only selects a route and source address
+            sock.connect((host, 53))
+        return True
+    except OSError:
+        return False
+
 def check_network() -> bool:
-    """Check for network connectivity."""
+    """Check for network connectivity; a positive result is remembered for the process."""
+    global _NETWORK_OK
+    if _NETWORK_OK:
+        return True
+    
     dns_servers = ["8.8.8.8", "1.1.1.1", "9.9.9.9"]
     
-    for dns in dns_servers:
-        try:
-            # Try connecting to DNS server with timeout
-            socket.create_connection((dns, 53), 3)
+    # No default route means no network; skip waiting on TCP timeouts
+    if not any(_has_route(dns) for dns in dns_servers):
+        print("No network connection detected. Please check your internet connection.")
+        return False
+    
+    def probe(dns: str) -> bool:
+        # Try connecting to DNS server with timeout
+        with socket.create_connection((dns, 53), 3):
             return True
-        except (socket.timeout, socket.error, OSError):
-            continue
+    
+    # Dial all servers at once and take the first one that answers
+    executor = ThreadPoolExecutor(max_workers=len(dns_servers))
+    try:
+        futures = [executor.submit(probe, dns) for dns in dns_servers]
+        for future in as_completed(futures, timeout=3.5):
+            if future.exception() is None:
+                _NETWORK_OK = True
+                return True
+    except FuturesTimeoutError:
+        pass
+    finally:
+        executor.shutdown(wait=False)
     
     print("No network connection detected. Please check your internet connection.")
     return False
@@ -212,29 +304,33 @@ def create_directory_if_not_exists(directory: str) -> bool:
         return False
 
 def get_executable_path(cmd: str) -> Optional[str]:
-    """Find the path to an executable, checking PATH and common locations."""
-    # Check in PATH first
-    cmd_path = shutil.which(cmd)
-    if cmd_path:
-        return cmd_path
-    
-    # Common Go tool installation locations
-    possible_locations = [
-        os.path.expanduser(f"~/go/bin/{cmd}"),           # User's go/bin
-        f"/root/go/bin/{cmd}",                           # Root's go/bin (common in Kali)
-        f"/usr/local/go/bin/{cmd}",                      # System Go installation
-        f"/usr/bin/{cmd}",                               # System package manager
-        f"/usr/local/bin/{cmd}",                         # Local installation
-        f"/opt/go/bin/{cmd}",                            # Alternative Go location
-        os.path.expanduser(f"~/.local/bin/{cmd}"),       # User's local bin
-        f"/snap/bin/{cmd}",                              # Snap packages
-    ]
+    """Find the path to an executable, checking PATH and common locations.
     
-    for path in possible_locations:
-        if os.path.exists(path) and os.access(path, os.X_OK):
-            return path
+    Found paths are cached for the rest of the process. Misses are not
+    cached, so a tool installed by go install is found on the next lookup.
+    """
+    cached = _EXECUTABLE_CACHE.get(cmd)
+    if cached:
+        return cached
     
-    return None
+    cmd_path = shutil.which(cmd)
+    if not cmd_path:
+        # Probe only the wanted name, and skip directories which() already searched
+        path_dirs = set(os.environ.get("PATH", "").split(os.pathsep))
+        for directory in _EXTRA_BIN_DIRS:
+            if directory in path_dirs:
+                continue
+            candidate = os.path.join(directory, cmd)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                cmd_path = candidate
+                break
+    if cmd_path:
+        _EXECUTABLE_CACHE[cmd] = cmd_path
+    return cmd_path
+
+def clear_executable_cache() -> None:
+    """Forget cached executable paths (e.g. after a tool was removed or reinstalled elsewhere)."""
+    _EXECUTABLE_CACHE.clear()
 
 def get_system_memory_gb() -> float:
     """
@@ -268,8 +364,7 @@ def ensure_executable(file_path: str) -> bool:
 
 def verify_linux_platform() -> bool:
     """Verify that the script is running on a Linux platform."""
-    import platform
-    if platform.system().lower() != "linux":
+    if not _IS_LINUX:
         print("This toolkit is designed EXCLUSIVELY for Linux systems.")
         print("Supported: Debian, Kali Linux, Ubuntu, Arch Linux")
         print("NOT Supported: Windows, macOS, WSL")
@@ -8,15 +8,14 @@ import os
 import sys
 import argparse
 import datetime
-import json
 import time
-import signal
 import platform
 import subprocess
 import shutil
 import socket
-import urllib.request
+import tempfile
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Optional, Dict, List, Any, Union, Tuple
 
 # Add parent directory to path for imports
@@ -76,6 +75,27 @@ except ImportError:
     def get_tool_specific_config(tool: str) -> Dict[str, Any]:
         return {}
 
+# Characters in a target that cannot appear in an output directory name
+TARGET_NAME_TABLE = str.maketrans('/:', '__')
+# Schemes that make a target a URL rather than a host, IP or CIDR range
+URL_SCHEMES = ('http://', 'https://')
+
+def is_url_target(target: str) -> bool:
+    """Return True if the scan target is an http(s) URL rather than a bare host."""
+    return target.startswith(URL_SCHEMES)
+
+def target_output_name(target: str) -> str:
+    """Return the output directory stem for a scan target.
+    
+    URL targets drop the scheme and any credentials but keep the port and
+    path, so http://host:8080/app and http://host/ get different names.
+    Hosts, IPs and CIDR ranges keep their full text.
+    """
+    if is_url_target(target):
+        parts = urlsplit(target)
+        target = parts.netloc.rpartition('@')[2] + parts.path.rstrip('/')
+    return target.translate(TARGET_NAME_TABLE)
+
 # Enhanced Real-time Output Functions
 def print_status_header(tool_name: str, target: str, action: str = "scan"):
     """Print a formatted status header for tool execution."""
@@ -146,26 +166,36 @@ def run_with_clean_output_only(cmd: List[str], output_file: Optional[str] = None
             print(f"[{tool_name}] ERROR: Executable not found: {cmd[0]}")
             return False, ""
         
-        # Start process with silent configuration
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,  # Separate stderr to avoid noise
-            universal_newlines=True,
-            bufsize=1,
-            cwd=os.getcwd()
-        )
-        
-        # Capture all output without displaying
-        stdout, stderr = process.communicate()
-        return_code = process.returncode
-          # Process stdout lines and filter for clean results
-        if stdout:
-            lines = stdout.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not is_noise_line(line):
-                    captured_output.append(line)
+        # stderr goes to a temp file so it never fills a pipe while stdout is read
+        with tempfile.TemporaryFile(mode='w+') as stderr_file:
+            # Start process with silent configuration
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,  # Separate stderr to avoid noise
+                universal_newlines=True,
+                bufsize=1,
+                cwd=os.getcwd()
+            )
+            
+            # Filter stdout as it arrives instead of buffering the whole output
+            if process.stdout is not None:
+                for line in process.stdout:
+                    line = line.strip()
+                    if line and not is_noise_line(line):
+                        captured_output.append(line)
+            return_code = process.wait()
+            
+            # Only a failed run reports errors, and only the first few; stop reading once found
+            relevant_errors = []
+            if return_code != 0:
+                stderr_file.seek(0)
+                for line in stderr_file:
+                    line = line.strip()
+                    if line and is_relevant_error(line):
+                        relevant_errors.append(line)
+                        if len(relevant_errors) == 3:
+                            break
         
         # Determine if scan was successful
         # For HTTPx, no results can be expected if no web services are running
@@ -183,11 +213,8 @@ def run_with_clean_output_only(cmd: List[str], output_file: Optional[str] = None
         else:
             print(f"[{tool_name}] Scan completed with errors - {len(captured_output)} results")
             # Add any relevant error info
-            if stderr and stderr.strip():
-                error_lines = [line.strip() for line in stderr.strip().split('\n') if line.strip()]
-                relevant_errors = [line for line in error_lines if is_relevant_error(line)]
-                if relevant_errors:
-                    print(f"[{tool_name}] Errors: {'; '.join(relevant_errors[:3])}")          # Save clean output to file in graphics-ready format
+            if relevant_errors:
+                print(f"[{tool_name}] Errors: {'; '.join(relevant_errors)}")          # Save clean output to file in graphics-ready format
         if output_file and captured_output:
             try:
                 # Use graphics formatting for the saved file
@@ -350,6 +377,7 @@ def run_with_enhanced_realtime_output(cmd: List[str], output_file: Optional[str]
     captured_output = []
     process = None
     line_count = 0
+    findings_count = 0
     
     try:
         print_progress_indicator(f"Starting {tool_name} execution", "SCAN")
@@ -389,6 +417,10 @@ def run_with_enhanced_realtime_output(cmd: List[str], output_file: Optional[str]
                 # Display line immediately
                 print(line)
                 captured_output.append(line)
+                # Keep a running total so the periodic status does not rescan all output
+                line_lower = line.lower()
+                if any(kw in line_lower for kw in ('found', 'open', 'vulnerable')):
+                    findings_count += 1
                 
                 # Show progress every 50 lines
                 if line_count % 50 == 0:
@@ -396,7 +428,6 @@ def run_with_enhanced_realtime_output(cmd: List[str], output_file: Optional[str]
                 
                 # Show periodic statistics for long-running scans
                 if line_count % 100 == 0:
-                    findings_count = len([l for l in captured_output if any(kw in l.lower() for kw in ['found', 'open', 'vulnerable'])])
                     print_progress_indicator(f"Status: {line_count} lines, {findings_count} potential findings detected", "INFO")
         
         # Wait for process to complete
@@ -552,6 +583,8 @@ def create_comprehensive_report_file(output_dir: str, target: str) -> str:
 def append_to_comprehensive_report(report_file: str, tool_name: str, content: str, success: bool):
     """Append tool results to the comprehensive report file with enhanced formatting."""
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Split once; the line list feeds both the length header and the analysis below
+    lines = content.splitlines() if content else []
     
     with open(report_file, 'a', encoding='utf-8') as f:
         f.write("=" * 80 + "\n")
@@ -560,12 +593,11 @@ def append_to_comprehensive_report(report_file: str, tool_name: str, content: st
         f.write(f"Tool: {tool_name}\n")
         f.write(f"Completion Time: {timestamp}\n")
         f.write(f"Status: {'SUCCESS' if success else 'FAILED'}\n")
-        f.write(f"Output Length: {len(content.splitlines()) if content else 0} lines\n")
+        f.write(f"Output Length: {len(lines)} lines\n")
         f.write("-" * 80 + "\n")
         
         if content and content.strip():
             # Add some basic analysis of the content
-            lines = content.splitlines()
             findings = []
             errors = []
             
@@ -1186,7 +1218,7 @@ def run_individual_tools(args, tool_paths: Dict[str, str], output_dir: str) -> b
         print(f"\nStarting nuclei vulnerability scan...")
 
         # Handle target input for nuclei
-        if not target.startswith(('http://', 'https://')):
+        if not is_url_target(target):
             print(f"Target doesn't specify protocol. Testing both HTTP and HTTPS...")
             nuclei_targets = [f"http://{target}", f"https://{target}"]
             
@@ -1710,21 +1742,32 @@ def create_realtime_summary(captured_output: List[str], tool_name: str) -> str:
     if not captured_output:
         return "No output captured yet."
     
+    tool = tool_name.lower()
     total_lines = len(captured_output)
-    findings_count = len([line for line in captured_output if any(kw in line.lower() for kw in ['found', 'open', 'vulnerable'])])
-    errors_count = len([line for line in captured_output if any(kw in line.lower() for kw in ['error', 'failed'])])
+    findings_count = errors_count = tool_count = 0
+    
+    # One pass over the output, lowercasing each line once, instead of a filtered list per metric
+    for line in captured_output:
+        line_lower = line.lower()
+        if any(kw in line_lower for kw in ('found', 'open', 'vulnerable')):
+            findings_count += 1
+        if any(kw in line_lower for kw in ('error', 'failed')):
+            errors_count += 1
+        if tool == 'naabu':
+            tool_count += 'open' in line_lower
+        elif tool == 'httpx':
+            tool_count += any(code in line for code in ('200', '301', '302', '403', '404'))
+        elif tool == 'nuclei':
+            tool_count += any(sev in line_lower for sev in ('critical', 'high', 'medium'))
     
     summary = f"Lines: {total_lines} | Findings: {findings_count} | Errors: {errors_count}"
       # Add tool-specific insights
-    if tool_name.lower() == 'naabu':
-        ports_found = len([line for line in captured_output if 'open' in line.lower()])
-        summary += f" | Open Ports: {ports_found}"
-    elif tool_name.lower() == 'httpx':
-        http_responses = len([line for line in captured_output if any(code in line for code in ['200', '301', '302', '403', '404'])])
-        summary += f" | HTTP Responses: {http_responses}"
-    elif tool_name.lower() == 'nuclei':
-        vulns = len([line for line in captured_output if any(sev in line.lower() for sev in ['critical', 'high', 'medium'])])
-        summary += f" | Vulnerabilities: {vulns}"
+    if tool == 'naabu':
+        summary += f" | Open Ports: {tool_count}"
+    elif tool == 'httpx':
+        summary += f" | HTTP Responses: {tool_count}"
+    elif tool == 'nuclei':
+        summary += f" | Vulnerabilities: {tool_count}"
     
     return summary
 
@@ -1786,8 +1829,40 @@ def create_enhanced_output_file(output_file: str, captured_output: List[str], to
         print_progress_indicator(f"Failed to create enhanced output file: {e}", "ERROR")
         return False
 
+# Successful connectivity checks are remembered across workflow runs for this long
+NETWORK_CHECK_TTL = 300
+NETWORK_CHECK_MARKER_NAME = "network-ok"
+
+def _network_check_marker():
+    """Per-user marker path; kept out of /tmp so other users cannot plant or remove it."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "mtscan" / NETWORK_CHECK_MARKER_NAME
+
 def check_network_connectivity():
-    """Check if network connection is available - required for all scans."""
+    """Check if network connection is available - required for all scans.
+    
+    Each scan from the menu starts a new workflow process, so a success is
+    recorded in a marker file and reused for NETWORK_CHECK_TTL seconds.
+    """
+    marker = _network_check_marker()
+    try:
+        if time.time() - marker.stat().st_mtime < NETWORK_CHECK_TTL:
+            print("  ✓ Network connectivity confirmed recently - skipping tests")
+            return True
+    except OSError:
+        pass
+    
+    if not _probe_network_connectivity():
+        return False
+    try:
+        marker.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass  # Caching is best effort
+    return True
+
+def _probe_network_connectivity():
+    """Run the connectivity tests, stopping at the first one that succeeds."""
     print("Testing network connectivity...")
       # Method 1: Try to connect to reliable DNS servers
     dns_servers = [
@@ -1846,6 +1921,8 @@ def check_network_connectivity():
         'https://github.com', 
         'https://1.1.1.1'
     ]
+    # urllib.request pulls in http.client/email/ssl, so only load it on this fallback path
+    import urllib.request
     for url in http_urls:
         try:
             print(f"  Trying HTTP connectivity test to {url}...")
@@ -1996,6 +2073,7 @@ def main():
         print("This toolkit is designed for Linux only. Exiting.")
         sys.exit(1)
       # Set up signal handler for graceful exit on CTRL+C
+    import signal
     signal.signal(signal.SIGINT, signal_handler)
     
     args = parser.parse_args()
@@ -2070,7 +2148,7 @@ def main():
             output_dir = args.output_dir
             os.makedirs(output_dir, exist_ok=True)
         else:
-            target_name = target.replace('/', '_').replace(':', '_')
+            target_name = target_output_name(target)
             output_dir = create_output_directory(target_name)
             if not output_dir:
                 print(" Failed to create output directory.")